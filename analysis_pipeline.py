@@ -570,10 +570,12 @@ class AnalysisPipeline:
             if not self.cache_enabled or not os.path.exists(self.cache_dir):
                 return
             
-            cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
+            with os.scandir(self.cache_dir) as entries:
+                cache_files = [entry.path for entry in entries
+                               if entry.name.endswith('.json') and entry.is_file()]
             
             for cache_file in cache_files:
-                os.remove(os.path.join(self.cache_dir, cache_file))
+                os.remove(cache_file)
             
             self.logger.info(f"Cache limpo: {len(cache_files)} arquivos removidos")
             
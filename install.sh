@@ -11,6 +11,14 @@ GREEN='\033[0;32m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
+# --clean: recria o venv do zero e atualiza o pip (reexecuções normais reaproveitam o venv)
+CLEAN=0
+for arg in "$@"; do
+    case "$arg" in
+        --clean) CLEAN=1 ;;
+    esac
+done
+
 # Função para logs
 log_info() {
     echo -e "${GREEN}[INFO]${NC} $1"
@@ -64,13 +72,19 @@ check_ffmpeg() {
 
 # Criar ambiente virtual
 create_venv() {
-    log_info "Criando ambiente virtual..."
-    if [ -d "venv" ]; then
-        log_warn "Ambiente virtual já existe. Removendo..."
+    if [ -d "venv" ] && [ "$CLEAN" -eq 1 ]; then
+        log_warn "Ambiente virtual já existe. Removendo (--clean)..."
         rm -rf venv
     fi
     
-    python3 -m venv venv
+    VENV_CREATED=0
+    if [ -d "venv" ]; then
+        log_info "Reutilizando ambiente virtual existente (use --clean para recriar)"
+    else
+        log_info "Criando ambiente virtual..."
+        python3 -m venv venv
+        VENV_CREATED=1
+    fi
     
     # Ativar ambiente virtual
     if [[ "$OSTYPE" == "msys" ]]; then
@@ -79,18 +93,20 @@ create_venv() {
         source venv/bin/activate
     fi
     
-    log_info "Ambiente virtual criado e ativado"
+    log_info "Ambiente virtual ativado"
 }
 
 # Instalar dependências
 install_dependencies() {
     log_info "Instalando dependências Python..."
     
-    # Upgrade pip
-    pip install --upgrade pip
+    # Upgrade pip apenas em venv novo ou com --clean
+    if [ "$VENV_CREATED" -eq 1 ] || [ "$CLEAN" -eq 1 ]; then
+        pip install --upgrade pip
+    fi
     
-    # Instalar dependências
-    pip install -r requirements.txt
+    # Instalar dependências (uma única chamada: o resolver do pip trata o lote todo)
+    pip install --prefer-binary --no-input -r requirements.txt
     
     log_info "Dependências instaladas com sucesso"
 }
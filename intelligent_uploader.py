@@ -18,6 +18,9 @@ from youtube_uploader import YouTubeUploader
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Extensões de vídeo aceitas para upload (tupla: um único endswith em C)
+_VIDEO_EXTS = ('.mp4', '.mov', '.mkv', '.webm')
+
 class IntelligentUploader:
     """Sistema inteligente que combina análise de conteúdo e agendamento otimizado"""
     
@@ -100,10 +103,12 @@ class IntelligentUploader:
     
     def _get_shorts_files(self) -> List[str]:
         """Retorna lista de arquivos de shorts"""
-        if not os.path.exists(self.shorts_dir):
+        try:
+            with os.scandir(self.shorts_dir) as entries:
+                files = [entry.name for entry in entries
+                         if entry.name.lower().endswith(_VIDEO_EXTS) and entry.is_file()]
+        except FileNotFoundError:
             return []
-        
-        files = [f for f in os.listdir(self.shorts_dir) if f.endswith('.mp4')]
         return sorted(files)
     
     def _analyze_original_content(self) -> Dict:
@@ -323,12 +328,14 @@ def main():
     
     # Verificar se há shorts para processar
     shorts_dir = "shorts"
-    if not os.path.exists(shorts_dir):
+    try:
+        with os.scandir(shorts_dir) as entries:
+            shorts_files = [entry.name for entry in entries
+                            if entry.name.lower().endswith(_VIDEO_EXTS) and entry.is_file()]
+    except FileNotFoundError:
         print("❌ Pasta 'shorts' não encontrada")
         print("💡 Execute primeiro: python3 production_script.py URL_VIDEO")
         sys.exit(1)
-    
-    shorts_files = [f for f in os.listdir(shorts_dir) if f.endswith('.mp4')]
     if not shorts_files:
         print("❌ Nenhum short encontrado")
         print("💡 Execute primeiro: python3 production_script.py URL_VIDEO")
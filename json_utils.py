@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+JSON Utils Module
+Serialização JSON com orjson opcional e fallback para a stdlib
+Canal: Your_Channel_Name
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # Dependência opcional: cai para o json da stdlib
+    orjson = None
+
+def json_loads(raw: bytes):
+    """Decodifica JSON usando orjson quando disponível"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def json_dumps(obj, indent: bool = True) -> bytes:
+    """Serializa para JSON UTF-8 usando orjson quando disponível"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # Tipo não suportado pelo orjson; usa a stdlib
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
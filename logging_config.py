@@ -6,17 +6,59 @@ Canal: Your_Channel_Name
 """
 
 import os
+import sys
+import time
+import queue
+import atexit
+import functools
 import logging
 import logging.handlers
 from datetime import datetime
 from typing import Optional
 
+# Separadores pré-computados para os blocos de log
+_SEP_EQ60 = "=" * 60
+_SEP_EQ50 = "=" * 50
+_SEP_DASH50 = "-" * 50
+_SEP_STAR60 = "*" * 60
+
+# Formatos padrão; o com origem da chamada (funcName/lineno) só vale quando não há 'format' explícito
+_DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_CALLER_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+
+# Cabeçalho fixo do banner de inicialização
+_BANNER = (
+    _SEP_EQ60,
+    "YouTube Shorts Automation - Your_Channel_Name",
+    "Sistema de logging iniciado",
+)
+
+class CachedFormatter(logging.Formatter):
+    """Formatter que reaproveita o asctime formatado dentro do mesmo segundo"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, None)
+    
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        cached_sec, cached_str = self._time_cache
+        if sec != cached_sec:
+            cached_str = time.strftime(datefmt or self.default_time_format, self.converter(sec))
+            self._time_cache = (sec, cached_str)
+        
+        if datefmt:
+            return cached_str
+        return self.default_msec_format % (cached_str, record.msecs)
+
 class AdvancedLogger:
     """Configuração avançada de logging com rotação por data"""
     
     def __init__(self, config: dict = None):
         self.config = config or self._get_default_config()
         self.logger = None
+        self._info_enabled = True
+        self._listener = None
         self.setup_logging()
     
     def _get_default_config(self) -> dict:
@@ -26,12 +68,14 @@ class AdvancedLogger:
             'file': 'logs/automation.log',
             'max_size': '10MB',
             'backup_count': 5,
-            'format': '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+            'format': None,  # None: usa o formato padrão conforme include_caller
+            'include_caller': False,  # funcName/lineno no formato padrão
             'datefmt': '%Y-%m-%d %H:%M:%S',
             'rotation': 'time',  # 'time' ou 'size'
             'when': 'midnight',  # Para rotação por tempo
             'interval': 1,
-            'console_output': True
+            'console_output': True,
+            'async_file_writes': True  # Escrita em arquivo por thread dedicada
         }
     
     def setup_logging(self):
@@ -46,11 +90,16 @@ class AdvancedLogger:
             self.logger.setLevel(getattr(logging, self.config['level'].upper()))
             
             # Remover handlers existentes para evitar duplicação
+            self.shutdown()
             self.logger.handlers.clear()
             
-            # Formatter
-            formatter = logging.Formatter(
-                self.config['format'],
+            # Formatter (um 'format' explícito sempre prevalece sobre include_caller)
+            log_format = self.config.get('format') or (
+                _CALLER_FORMAT if self.config.get('include_caller', False) else _DEFAULT_FORMAT
+            )
+            
+            formatter = CachedFormatter(
+                log_format,
                 datefmt=self.config['datefmt']
             )
             
@@ -74,12 +123,24 @@ class AdvancedLogger:
                 )
             
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            
+            if self.config.get('async_file_writes', True):
+                # Escrita em arquivo fora da thread produtora: o emit vira um put na fila
+                log_queue = queue.SimpleQueue()
+                self._listener = logging.handlers.QueueListener(
+                    log_queue, file_handler, respect_handler_level=True
+                )
+                self._listener.start()
+                # Registrado só enquanto há listener; shutdown remove o callback (e a referência)
+                atexit.register(self.shutdown)
+                self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            else:
+                self.logger.addHandler(file_handler)
             
             # Handler para console (se habilitado)
             if self.config['console_output']:
                 console_handler = logging.StreamHandler()
-                console_formatter = logging.Formatter(
+                console_formatter = CachedFormatter(
                     '%(asctime)s - %(levelname)s - %(message)s',
                     datefmt='%H:%M:%S'
                 )
@@ -87,19 +148,32 @@ class AdvancedLogger:
                 self.logger.addHandler(console_handler)
             
             # Log inicial
-            self.logger.info("="*60)
-            self.logger.info("YouTube Shorts Automation - Your_Channel_Name")
-            self.logger.info("Sistema de logging iniciado")
+            for line in _BANNER:
+                self.logger.info(line)
             self.logger.info(f"Nível: {self.config['level']}")
             self.logger.info(f"Arquivo: {self.config['file']}")
             self.logger.info(f"Rotação: {self.config['rotation']}")
-            self.logger.info("="*60)
+            self.logger.info(_SEP_EQ60)
+            
+            # Cache do nível para evitar formatação quando INFO está suprimido
+            self._info_enabled = self.logger.isEnabledFor(logging.INFO)
             
         except Exception as e:
-            print(f"Erro ao configurar logging: {str(e)}")
+            sys.stderr.write("Erro ao configurar logging: " + str(e) + "\n")
             raise
     
-    def _parse_size(self, size_str: str) -> int:
+    def shutdown(self):
+        """Para a thread de escrita em arquivo, descarregando registros pendentes"""
+        if self._listener is not None:
+            atexit.unregister(self.shutdown)
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _parse_size(size_str: str) -> int:
         """Converte string de tamanho para bytes"""
         size_str = size_str.upper()
         if size_str.endswith('KB'):
@@ -111,6 +185,13 @@ class AdvancedLogger:
         else:
             return int(size_str)
     
+    def set_level(self, level):
+        """Altera o nível do logger e atualiza o cache de nível"""
+        if isinstance(level, str):
+            level = getattr(logging, level.upper())
+        self.logger.setLevel(level)
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
+    
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """Retorna logger configurado"""
         if name:
@@ -119,23 +200,29 @@ class AdvancedLogger:
     
     def log_process_start(self, process_name: str, **kwargs):
         """Log padronizado para início de processo"""
-        self.logger.info("="*50)
+        if not self._info_enabled:
+            return
+        self.logger.info(_SEP_EQ50)
         self.logger.info(f"INICIANDO: {process_name}")
         for key, value in kwargs.items():
             self.logger.info(f"  {key}: {value}")
-        self.logger.info("="*50)
+        self.logger.info(_SEP_EQ50)
     
     def log_process_end(self, process_name: str, success: bool = True, **kwargs):
         """Log padronizado para fim de processo"""
+        if not self._info_enabled:
+            return
         status = "SUCESSO" if success else "ERRO"
-        self.logger.info("-"*50)
+        self.logger.info(_SEP_DASH50)
         self.logger.info(f"FINALIZANDO: {process_name} - {status}")
         for key, value in kwargs.items():
             self.logger.info(f"  {key}: {value}")
-        self.logger.info("-"*50)
+        self.logger.info(_SEP_DASH50)
     
     def log_step(self, step_name: str, step_number: int = None, total_steps: int = None):
         """Log padronizado para etapas de processo"""
+        if not self._info_enabled:
+            return
         if step_number and total_steps:
             self.logger.info(f"ETAPA {step_number}/{total_steps}: {step_name}")
         else:
@@ -143,12 +230,14 @@ class AdvancedLogger:
     
     def log_progress(self, current: int, total: int, item_name: str = "item"):
         """Log de progresso"""
+        if not self._info_enabled:
+            return
         percentage = (current / total) * 100
         self.logger.info(f"Progresso: {current}/{total} {item_name}s ({percentage:.1f}%)")
     
     def log_error_details(self, error: Exception, context: str = ""):
         """Log detalhado de erros"""
-        self.logger.error("*"*60)
+        self.logger.error(_SEP_STAR60)
         self.logger.error(f"ERRO DETALHADO: {context}")
         self.logger.error(f"Tipo: {type(error).__name__}")
         self.logger.error(f"Mensagem: {str(error)}")
@@ -159,7 +248,7 @@ class AdvancedLogger:
         for line in traceback.format_exc().split('\n'):
             if line.strip():
                 self.logger.error(f"  {line}")
-        self.logger.error("*"*60)
+        self.logger.error(_SEP_STAR60)
     
     def log_video_info(self, video_info: dict):
         """Log especializado para informações de vídeo"""
@@ -214,7 +303,7 @@ class AdvancedLogger:
         
         # Handler específico para sessão
         session_handler = logging.FileHandler(session_file, encoding='utf-8')
-        formatter = logging.Formatter(
+        formatter = CachedFormatter(
             '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%H:%M:%S'
         )
@@ -234,22 +323,24 @@ class AdvancedLogger:
         if not os.path.exists(log_dir):
             return
         
-        current_time = datetime.now()
+        cutoff = time.time() - max_age_days * 86400
         removed_count = 0
         
-        for filename in os.listdir(log_dir):
-            if filename.endswith('.log'):
-                file_path = os.path.join(log_dir, filename)
-                file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-                age_days = (current_time - file_time).days
-                
-                if age_days > max_age_days:
-                    try:
-                        os.remove(file_path)
-                        removed_count += 1
-                        self.logger.info(f"Log antigo removido: {filename}")
-                    except Exception as e:
-                        self.logger.error(f"Erro ao remover log {filename}: {str(e)}")
+        # scandir reaproveita os metadados da listagem (DirEntry.stat é cacheado)
+        with os.scandir(log_dir) as entries:
+            victims = [
+                (entry.name, entry.path) for entry in entries
+                if entry.name.endswith('.log') and entry.stat().st_ctime < cutoff
+            ]
+        
+        # Remoção em lote, com o diretório já fechado
+        for filename, file_path in victims:
+            try:
+                os.remove(file_path)
+                removed_count += 1
+                self.logger.info(f"Log antigo removido: {filename}")
+            except Exception as e:
+                self.logger.error(f"Erro ao remover log {filename}: {str(e)}")
         
         if removed_count > 0:
             self.logger.info(f"Limpeza de logs concluída: {removed_count} arquivos removidos")
@@ -260,6 +351,8 @@ _global_logger = None
 def setup_global_logger(config: dict = None) -> AdvancedLogger:
     """Configura logger global"""
     global _global_logger
+    if _global_logger is not None:
+        _global_logger.shutdown()
     _global_logger = AdvancedLogger(config)
     return _global_logger
 
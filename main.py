@@ -6,24 +6,54 @@ Canal: Your_Channel_Name
 """
 
 import os
+import sys
 import json
-import logging
-import schedule
+import argparse
+import subprocess
 import time
+import shutil
+import signal
+import asyncio
+import heapq
+import functools
+import operator
+import queue
+import hashlib
+import logging
+import logging.handlers
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, asdict
 
 # Importar nossos módulos
+from json_utils import json_dumps, json_loads
 from video_downloader import VideoDownloader
 from video_processor import VideoProcessor
-from logging_config import setup_global_logger, get_logger
+from logging_config import setup_global_logger, get_logger, AdvancedLogger
 from system_validator import SystemValidator
 from youtube_uploader import YouTubeUploader
 from upload_scheduler import UploadScheduler
 from system_monitor import SystemMonitor
 
-@dataclass
+# Módulos de análise/criação dependem de bibliotecas pesadas e opcionais
+try:
+    from analysis_pipeline import AnalysisPipeline
+except ImportError:
+    AnalysisPipeline = None
+
+try:
+    from shorts_batch_processor import ShortsBatchProcessor
+except ImportError:
+    ShortsBatchProcessor = None
+
+# Cache da validação do sistema entre execuções
+VALIDATION_CACHE_FILE = "temp/validation_cache.json"
+VALIDATION_CACHE_TTL = 3600  # segundos
+
+@dataclass(slots=True)
 class VideoData:
     """Estrutura de dados para informações de vídeo"""
     id: str
@@ -34,19 +64,185 @@ class VideoData:
     download_info: Dict
     processing_info: Dict
     validation_result: Dict
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
-        """Converte para dicionário"""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'duration': self.duration,
-            'local_path': self.local_path,
-            'download_info': self.download_info,
-            'processing_info': self.processing_info,
-            'validation_result': self.validation_result
-        }
+        """Converte para dicionário (construído uma única vez)"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self.id,
+                'title': self.title,
+                'description': self.description,
+                'duration': self.duration,
+                'local_path': self.local_path,
+                'download_info': self.download_info,
+                'processing_info': self.processing_info,
+                'validation_result': self.validation_result
+            }
+        return self._dict_cache
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialização JSON (UTF-8) memoizada do vídeo"""
+        if self._json_cache is None:
+            self._json_cache = json_dumps(self.to_dict(), indent=False)
+        return self._json_cache
+
+@functools.lru_cache(maxsize=1)
+def _iso_now_second(second: int) -> str:
+    """Timestamp ISO de um segundo (memoizado: chamadas no mesmo segundo reaproveitam a string)"""
+    return datetime.fromtimestamp(second).isoformat()
+
+def _iso_now() -> str:
+    """Timestamp ISO atual com resolução de segundos"""
+    return _iso_now_second(int(time.time()))
+
+def _format_kwargs(kwargs: Dict) -> str:
+    """Junta detalhes do processo em uma única linha"""
+    return " | ".join(f"{key}={value}" for key, value in kwargs.items())
+
+def _basic_log_process_start(logger: logging.Logger, process_name: str, **kwargs):
+    """Início de processo em um único registro (logging básico)"""
+    if kwargs:
+        logger.info(f"INICIANDO: {process_name} | {_format_kwargs(kwargs)}")
+    else:
+        logger.info(f"INICIANDO: {process_name}")
+
+def _basic_log_process_end(logger: logging.Logger, process_name: str, success: bool = True, **kwargs):
+    """Fim de processo em um único registro (logging básico)"""
+    status = "SUCESSO" if success else "ERRO"
+    if kwargs:
+        logger.info(f"FINALIZANDO: {process_name} - {status} | {_format_kwargs(kwargs)}")
+    else:
+        logger.info(f"FINALIZANDO: {process_name} - {status}")
+
+def _basic_log_step(logger: logging.Logger, step_name: str, step_number: int = None, total_steps: int = None):
+    """Etapa de processo (logging básico)"""
+    if step_number and total_steps:
+        logger.info(f"ETAPA {step_number}/{total_steps}: {step_name}")
+    else:
+        logger.info(f"ETAPA: {step_name}")
+
+def _basic_log_error_details(logger: logging.Logger, error: Exception, context: str = ""):
+    """Erro resumido (logging básico)"""
+    logger.error(f"ERRO em {context}: {str(error)}")
+
+def _attach_basic_log_methods(logger: logging.Logger):
+    """Adiciona ao logger os métodos padronizados esperados pelo pipeline"""
+    logger.log_process_start = functools.partial(_basic_log_process_start, logger)
+    logger.log_process_end = functools.partial(_basic_log_process_end, logger)
+    logger.log_step = functools.partial(_basic_log_step, logger)
+    logger.log_error_details = functools.partial(_basic_log_error_details, logger)
+
+# Padrões do agendamento personalizado e extração das chaves em uma chamada
+_CUSTOM_SCHEDULE_DEFAULTS = {
+    'days_duration': 7,
+    'videos_per_day': 3,
+    'daily_times': ('08:00', '12:00', '18:30'),
+    'start_date': None
+}
+_CUSTOM_SCHEDULE_KEYS = operator.itemgetter('days_duration', 'videos_per_day', 'daily_times', 'start_date')
+
+def _section_kwargs(cls, section: Optional[Dict]) -> Dict:
+    """Filtra uma seção do config.json para os campos conhecidos da dataclass"""
+    names = {f.name for f in fields(cls)}
+    return {key: value for key, value in (section or {}).items() if key in names}
+
+@dataclass(slots=True, frozen=True)
+class DirectoriesCfg:
+    """Diretórios de trabalho"""
+    downloads: str = './downloads'
+    shorts: str = './shorts'
+    logs: str = './logs'
+    config: str = './config'
+    temp: str = './temp'
+
+@dataclass(slots=True, frozen=True)
+class ShortsCfg:
+    """Configuração dos shorts gerados"""
+    duration: int = 60
+    count_per_video: int = 7
+    resolution: str = '720x1280'
+    fps: int = 30
+    bitrate: str = '1.5M'
+    audio_bitrate: str = '128k'
+
+@dataclass(slots=True, frozen=True)
+class UploadScheduleCfg:
+    """Configuração do agendamento de uploads"""
+    time: str = '07:00'
+    timezone: str = 'America/Sao_Paulo'
+    daily: bool = True
+
+@dataclass(slots=True, frozen=True)
+class LoggingCfg:
+    """Configuração do logging avançado (mesmos padrões do AdvancedLogger)"""
+    level: str = 'INFO'
+    file: str = 'logs/automation.log'
+    max_size: str = '10MB'
+    backup_count: int = 5
+    format: Optional[str] = None
+    include_caller: bool = False
+    datefmt: str = '%Y-%m-%d %H:%M:%S'
+    rotation: str = 'time'
+    when: str = 'midnight'
+    interval: int = 1
+    console_output: bool = True
+    async_file_writes: bool = True
+
+@dataclass(slots=True, frozen=True)
+class AutomationConfig:
+    """Visão tipada e imutável do config.json, montada uma vez em load_config"""
+    directories: DirectoriesCfg = field(default_factory=DirectoriesCfg)
+    shorts_config: ShortsCfg = field(default_factory=ShortsCfg)
+    upload_schedule: UploadScheduleCfg = field(default_factory=UploadScheduleCfg)
+    hashtags: tuple = ()
+    logging: Optional[LoggingCfg] = None  # None: sem seção 'logging', usa o logging básico
+    
+    @classmethod
+    def from_dict(cls, raw: Dict) -> 'AutomationConfig':
+        """Constrói a configuração a partir do JSON bruto, ignorando chaves desconhecidas"""
+        return cls(
+            directories=DirectoriesCfg(**_section_kwargs(DirectoriesCfg, raw.get('directories'))),
+            shorts_config=ShortsCfg(**_section_kwargs(ShortsCfg, raw.get('shorts_config'))),
+            upload_schedule=UploadScheduleCfg(**_section_kwargs(UploadScheduleCfg, raw.get('upload_schedule'))),
+            hashtags=tuple(raw.get('hashtags', ())),
+            logging=LoggingCfg(**_section_kwargs(LoggingCfg, raw['logging'])) if raw.get('logging') else None
+        )
+
+# Análise em processo dedicado: progresso e logs do worker voltam por uma fila
+_analysis_events = None
+
+# Último evento de cada análise: tudo que o worker enviou antes já está na fila
+_ANALYSIS_DONE = None
+
+def _init_analysis_worker(events, log_level: int):
+    """Inicializa o processo de análise, encaminhando logs para o processo principal"""
+    global _analysis_events
+    _analysis_events = events
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(events)]
+    root.setLevel(log_level)
+
+def _report_analysis_progress(analysis_type: str, progress: float, status: str):
+    """Callback de progresso usado dentro do processo de análise"""
+    _analysis_events.put((analysis_type, progress, status))
+
+def _run_analysis_worker(pipeline_config: Dict, video_path: str,
+                         shorts_duration: int, shorts_count: int) -> Dict:
+    """Executa o pipeline de análise completo no processo de análise"""
+    try:
+        pipeline = AnalysisPipeline(dict(pipeline_config, progress_callback=_report_analysis_progress))
+        try:
+            return pipeline.analyze_video_complete(
+                video_path=video_path,
+                shorts_duration=shorts_duration,
+                shorts_count=shorts_count
+            )
+        finally:
+            pipeline.cleanup()
+    finally:
+        _analysis_events.put(_ANALYSIS_DONE)
 
 class YouTubeAutomation:
     """Classe principal para automação de YouTube Shorts"""
@@ -54,8 +250,13 @@ class YouTubeAutomation:
     def __init__(self, config_path: str = "config/config.json"):
         """Inicializa o sistema de automação"""
         self.config_path = config_path
-        self.config = {}
+        self.cfg = AutomationConfig()  # Única fonte da configuração carregada
         self.logger = None
+        self._log_listener = None
+        self._log_queue_handler = None
+        self._analysis_pool = None
+        self._analysis_events = None
+        self._shorts_processor = None
         
         # Validar sistema primeiro
         self.validate_system()
@@ -63,11 +264,15 @@ class YouTubeAutomation:
         # Carregar configuração
         self.load_config()
         
+        # Materializar de uma vez os diretórios usados pelo pipeline
+        for directory in {self.cfg.directories.shorts, 'temp', 'backup', 'logs'}:
+            os.makedirs(directory, exist_ok=True)
+        
         # Configurar logging avançado
         self.setup_advanced_logging()
         
         # Inicializar componentes
-        self.downloader = VideoDownloader(self.config['directories']['downloads'])
+        self.downloader = VideoDownloader(self.cfg.directories.downloads)
         self.processor = VideoProcessor()
         
         # Componentes de upload e agendamento
@@ -82,8 +287,14 @@ class YouTubeAutomation:
         """Valida sistema antes de inicializar"""
         print("🔍 Validando sistema...")
         
-        validator = SystemValidator(self.config_path)
-        results = validator.run_full_validation()
+        cache_key = self._validation_cache_key()
+        results = self._load_validation_cache(cache_key)
+        
+        if results is None:
+            validator = SystemValidator(self.config_path)
+            results = validator.run_full_validation()
+            if results['summary']['success']:
+                self._save_validation_cache(cache_key, results)
         
         if not results['summary']['success']:
             print("\n❌ Sistema possui problemas críticos:")
@@ -101,11 +312,44 @@ class YouTubeAutomation:
             for warning in results['warnings']:
                 print(f"   • {warning}")
         
+    def _validation_cache_key(self) -> str:
+        """Chave que invalida o cache quando config, Python ou FFmpeg mudam"""
+        try:
+            config_mtime = os.path.getmtime(self.config_path)
+        except OSError:
+            config_mtime = None
+        
+        raw_key = f"{config_mtime}|{sys.version}|{shutil.which('ffmpeg')}|{os.environ.get('PATH', '')}"
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+    
+    def _load_validation_cache(self, cache_key: str) -> Optional[Dict]:
+        """Retorna resultado de validação em cache se ainda válido"""
+        try:
+            with open(VALIDATION_CACHE_FILE, 'rb') as f:
+                cache = json_loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            return None
+        
+        if cache.get('key') != cache_key or time.time() - cache.get('ts', 0) >= VALIDATION_CACHE_TTL:
+            return None
+        
+        return cache.get('results')
+    
+    def _save_validation_cache(self, cache_key: str, results: Dict):
+        """Salva resultado de validação bem-sucedida"""
+        try:
+            os.makedirs(os.path.dirname(VALIDATION_CACHE_FILE), exist_ok=True)
+            with open(VALIDATION_CACHE_FILE, 'wb') as f:
+                f.write(json_dumps({'key': cache_key, 'ts': time.time(), 'results': results}))
+        except OSError:
+            pass
+    
     def load_config(self):
         """Carrega configurações do arquivo JSON"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                raw_config = json_loads(f.read())
+            self.cfg = AutomationConfig.from_dict(raw_config)
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo de configuração não encontrado: {self.config_path}")
         except json.JSONDecodeError as e:
@@ -114,23 +358,32 @@ class YouTubeAutomation:
     def setup_advanced_logging(self):
         """Configura sistema de logging avançado"""
         try:
-            log_config = self.config.get('logging', {})
-            
             # Configuração básica se não tiver avançada
-            if not log_config:
-                logging.basicConfig(
-                    level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    handlers=[
-                        logging.FileHandler('logs/automation.log'),
-                        logging.StreamHandler()
-                    ]
-                )
+            if self.cfg.logging is None:
+                root = logging.getLogger()
+                # basicConfig não faz nada se o root já tem handlers: nesse caso usa os existentes
+                if not root.handlers:
+                    # Handlers reais ficam numa thread dedicada; emitir vira um put na fila
+                    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+                    file_handler = logging.FileHandler('logs/automation.log')
+                    stream_handler = logging.StreamHandler()
+                    file_handler.setFormatter(formatter)
+                    stream_handler.setFormatter(formatter)
+                    
+                    log_queue = queue.SimpleQueue()
+                    self._log_queue_handler = logging.handlers.QueueHandler(log_queue)
+                    self._log_listener = logging.handlers.QueueListener(
+                        log_queue, file_handler, stream_handler, respect_handler_level=True
+                    )
+                    self._log_listener.start()
+                    
+                    root.addHandler(self._log_queue_handler)
+                    root.setLevel(logging.INFO)
                 self.logger = logging.getLogger('Main')
+                _attach_basic_log_methods(self.logger)
             else:
                 # Configurar logger global
-                from logging_config import AdvancedLogger
-                logger_instance = AdvancedLogger(log_config)
+                logger_instance = AdvancedLogger(asdict(self.cfg.logging))
                 self.logger = logger_instance.get_logger('Main')
                 
                 # Adicionar métodos ao logger
@@ -145,32 +398,8 @@ class YouTubeAutomation:
             self.logger = logging.getLogger('Main')
             self.logger.warning(f"Erro no logging avançado, usando básico: {e}")
             
-            # Adicionar métodos dummy para compatibilidade
-            def dummy_log_process_start(process_name: str, **kwargs):
-                self.logger.info(f"INICIANDO: {process_name}")
-                for key, value in kwargs.items():
-                    self.logger.info(f"  {key}: {value}")
-            
-            def dummy_log_process_end(process_name: str, success: bool = True, **kwargs):
-                status = "SUCESSO" if success else "ERRO"
-                self.logger.info(f"FINALIZANDO: {process_name} - {status}")
-                for key, value in kwargs.items():
-                    self.logger.info(f"  {key}: {value}")
-            
-            def dummy_log_step(step_name: str, step_number: int = None, total_steps: int = None):
-                if step_number and total_steps:
-                    self.logger.info(f"ETAPA {step_number}/{total_steps}: {step_name}")
-                else:
-                    self.logger.info(f"ETAPA: {step_name}")
-            
-            def dummy_log_error_details(error: Exception, context: str = ""):
-                self.logger.error(f"ERRO em {context}: {str(error)}")
-                
-            # Atribuir métodos dummy
-            self.logger.log_process_start = dummy_log_process_start
-            self.logger.log_process_end = dummy_log_process_end
-            self.logger.log_step = dummy_log_step
-            self.logger.log_error_details = dummy_log_error_details
+            # Adicionar métodos básicos para compatibilidade
+            _attach_basic_log_methods(self.logger)
         
     def download_video(self, url: str) -> Optional[VideoData]:
         """
@@ -254,34 +483,36 @@ class YouTubeAutomation:
         self.logger.log_step("Análise inteligente de vídeo")
         
         try:
-            # Importar pipeline de análise
-            from analysis_pipeline import AnalysisPipeline
+            if AnalysisPipeline is None:
+                raise ImportError("Dependências do pipeline de análise não instaladas")
             
-            # Configurar pipeline
+            # Configurar pipeline (o callback de progresso é definido no worker)
             pipeline_config = {
                 'cache_enabled': True,
                 'cache_dir': 'temp/cache',
                 'max_workers': 3,
                 'export_graphs': True,
-                'analysis_interval': 1.0,
-                'progress_callback': self._analysis_progress_callback
+                'analysis_interval': 1.0
             }
             
-            # Inicializar pipeline
-            pipeline = AnalysisPipeline(pipeline_config)
-            
             # Configurações dos shorts
-            shorts_duration = self.config['shorts_config']['duration']
-            shorts_count = self.config['shorts_config']['count_per_video']
+            shorts_duration = self.cfg.shorts_config.duration
+            shorts_count = self.cfg.shorts_config.count_per_video
             
             self.logger.info(f"Iniciando análise IA: {shorts_count} shorts de {shorts_duration}s")
             
-            # Executar análise completa
-            complete_analysis = pipeline.analyze_video_complete(
-                video_path=video_data.local_path,
-                shorts_duration=shorts_duration,
-                shorts_count=shorts_count
-            )
+            # Executar análise completa em processo separado (fora do GIL deste processo)
+            try:
+                future = self._get_analysis_pool().submit(
+                    _run_analysis_worker, pipeline_config, video_data.local_path,
+                    shorts_duration, shorts_count
+                )
+                self._relay_analysis_events(future)
+                complete_analysis = future.result()
+            except BrokenProcessPool:
+                # Worker morreu (ex.: OOM): o pool fica inutilizável e é recriado na próxima análise
+                self.release_analysis_worker()
+                raise
             
             # Extrair informações relevantes
             analysis_data = {
@@ -293,27 +524,58 @@ class YouTubeAutomation:
                 'audio_analysis': complete_analysis['analysis_results']['audio']['summary'],
                 'visual_analysis': complete_analysis['analysis_results']['visual']['summary'],
                 'speech_analysis': complete_analysis['analysis_results']['speech']['summary'],
-                'analyzed_at': datetime.now().isoformat()
+                'analyzed_at': _iso_now()
             }
             
             # Log resumo da análise
             self.logger.info(f"Análise IA concluída em {analysis_data['analysis_time']:.1f}s")
             self.logger.info(f"Encontrados {analysis_data['segments_found']} segmentos candidatos")
             
-            # Log dos melhores segmentos
-            for i, segment in enumerate(analysis_data['best_segments'][:3], 1):
+            # Log dos melhores segmentos (best_segments vem ordenado por tempo)
+            top_segments = heapq.nlargest(3, analysis_data['best_segments'],
+                                          key=lambda segment: segment['combined_score'])
+            for i, segment in enumerate(top_segments, 1):
                 self.logger.info(f"Top {i}: {segment['start_time']:.1f}s-{segment['end_time']:.1f}s "
                                f"(score: {segment['combined_score']:.3f})")
             
-            # Limpeza do pipeline
-            pipeline.cleanup()
-            
             return analysis_data
             
         except Exception as e:
             self.logger.log_error_details(e, "Análise IA de vídeo")
             raise
     
+    def _get_analysis_pool(self) -> ProcessPoolExecutor:
+        """Cria sob demanda o processo dedicado à análise"""
+        if self._analysis_pool is None:
+            # spawn: o worker não herda threads/handlers de logging deste processo
+            context = multiprocessing.get_context('spawn')
+            self._analysis_events = context.Queue()
+            self._analysis_pool = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=_init_analysis_worker,
+                initargs=(self._analysis_events, logging.getLogger().level)
+            )
+        return self._analysis_pool
+    
+    def _relay_analysis_events(self, future):
+        """Repassa progresso e logs do processo de análise até o evento final do worker"""
+        while True:
+            try:
+                event = self._analysis_events.get(timeout=0.5)
+            except queue.Empty:
+                # Sem evento final só se o processo morreu antes de enviá-lo
+                if future.done() and isinstance(future.exception(), BrokenProcessPool):
+                    break
+                continue
+            
+            if event is _ANALYSIS_DONE:
+                break
+            if isinstance(event, logging.LogRecord):
+                logging.getLogger(event.name).handle(event)
+            else:
+                self._analysis_progress_callback(*event)
+    
     def _analysis_progress_callback(self, analysis_type: str, progress: float, status: str):
         """Callback para progresso da análise IA"""
         if progress >= 0:
@@ -326,8 +588,8 @@ class YouTubeAutomation:
         self.logger.log_step("Criação automática de shorts")
         
         try:
-            # Importar processador de shorts
-            from shorts_batch_processor import ShortsBatchProcessor
+            if ShortsBatchProcessor is None:
+                raise ImportError("Dependências do processador de shorts não instaladas")
             
             # Extrair segmentos da análise
             best_segments = analysis_data.get('best_segments', [])
@@ -336,22 +598,10 @@ class YouTubeAutomation:
                 self.logger.error("Nenhum segmento encontrado para criar shorts")
                 return []
             
-            # Configurar processador
-            processor_config = {
-                'output_dir': self.config['directories']['shorts'],
-                'backup_original': True,
-                'backup_dir': 'backup',
-                'max_parallel_jobs': 2,
-                'create_thumbnails': True,
-                'save_metadata_files': True,
-                'progress_callback': self._shorts_progress_callback
-            }
-            
-            # Inicializar processador
-            processor = ShortsBatchProcessor(processor_config)
+            processor = self._get_shorts_processor()
             
             # Configurar hashtags do canal
-            hashtags = self.config.get('hashtags', [])
+            hashtags = list(self.cfg.hashtags)
             
             self.logger.info(f"Iniciando criação de {len(best_segments)} shorts")
             
@@ -375,15 +625,17 @@ class YouTubeAutomation:
             
             self.logger.info(f"Criação concluída: {success_count}/{total_shorts} shorts ({success_rate:.1f}% sucesso)")
             
-            # Log detalhes dos shorts criados
-            for short in successful_shorts:
-                self.logger.info(f"✓ {short['filename']} - {short['file_size']/1024/1024:.1f}MB")
+            # Log detalhes dos shorts criados (um único registro)
+            if successful_shorts:
+                self.logger.info("Shorts criados:\n" + "\n".join(
+                    f"✓ {short['filename']} - {short['file_size']/1024/1024:.1f}MB"
+                    for short in successful_shorts
+                ))
             
             # Salvar relatório detalhado
             report_file = "temp/shorts_creation_report.json"
-            os.makedirs(os.path.dirname(report_file), exist_ok=True)
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(batch_report, f, indent=2, ensure_ascii=False)
+            with open(report_file, 'wb') as f:
+                f.write(json_dumps(batch_report))
             
             self.logger.info(f"Relatório detalhado salvo: {report_file}")
             
@@ -396,6 +648,24 @@ class YouTubeAutomation:
             self.logger.log_error_details(e, "Criação de shorts")
             return []
     
+    def _get_shorts_processor(self) -> 'ShortsBatchProcessor':
+        """Processador de shorts criado sob demanda e reaproveitado entre vídeos"""
+        if self._shorts_processor is None:
+            # Configurar processador
+            processor_config = {
+                'output_dir': self.cfg.directories.shorts,
+                'backup_original': True,
+                'backup_dir': 'backup',
+                'max_parallel_jobs': 2,
+                'create_thumbnails': True,
+                'save_metadata_files': True,
+                'progress_callback': self._shorts_progress_callback
+            }
+            
+            # Mantém o pool de renderização entre os vídeos da sessão
+            self._shorts_processor = ShortsBatchProcessor(processor_config)
+        return self._shorts_processor
+    
     def _shorts_progress_callback(self, step: str, progress: float, details: str):
         """Callback para progresso da criação de shorts"""
         self.logger.info(f"[SHORTS] {step}: {progress:.0f}% - {details}")
@@ -404,6 +674,17 @@ class YouTubeAutomation:
         """
         Inicializa sistema de upload e agendamento
         
+        Returns:
+            True se inicialização bem-sucedida
+        """
+        return asyncio.run(self.initialize_upload_system_async())
+    
+    async def initialize_upload_system_async(self) -> bool:
+        """
+        Inicializa sistema de upload e agendamento. A autenticação OAuth e a
+        construção do scheduler e do monitor rodam em paralelo; só a ligação
+        final entre os componentes depende da autenticação.
+        
         Returns:
             True se inicialização bem-sucedida
         """
@@ -423,23 +704,15 @@ class YouTubeAutomation:
             
             self.uploader = YouTubeUploader(uploader_config)
             
-            # Autenticar
-            if not self.uploader.authenticate():
-                self.logger.error("Falha na autenticação do YouTube")
-                return False
-            
             # Configurar scheduler
             scheduler_config = {
-                'upload_time': self.config.get('upload_schedule', {}).get('time', '07:00'),
-                'timezone': self.config.get('upload_schedule', {}).get('timezone', 'America/Sao_Paulo'),
+                'upload_time': self.cfg.upload_schedule.time,
+                'timezone': self.cfg.upload_schedule.timezone,
                 'daily_uploads': True,
                 'max_concurrent_uploads': 1,
                 'check_interval': 60
             }
             
-            self.scheduler = UploadScheduler(scheduler_config)
-            self.scheduler.set_uploader(self.uploader)
-            
             # Configurar monitor
             monitor_config = {
                 'monitor_interval': 30,
@@ -449,7 +722,22 @@ class YouTubeAutomation:
                 'dashboard_refresh': 5
             }
             
-            self.monitor = SystemMonitor(monitor_config)
+            # Autenticar enquanto scheduler e monitor são construídos
+            loop = asyncio.get_running_loop()
+            authenticated, scheduler, monitor = await asyncio.gather(
+                loop.run_in_executor(None, self.uploader.authenticate),
+                loop.run_in_executor(None, UploadScheduler, scheduler_config),
+                loop.run_in_executor(None, SystemMonitor, monitor_config)
+            )
+            
+            if not authenticated:
+                self.logger.error("Falha na autenticação do YouTube")
+                return False
+            
+            self.scheduler = scheduler
+            self.scheduler.set_uploader(self.uploader)
+            
+            self.monitor = monitor
             self.monitor.set_components(scheduler=self.scheduler, uploader=self.uploader)
             
             self.logger.info("Sistema de upload inicializado com sucesso")
@@ -488,10 +776,9 @@ class YouTubeAutomation:
             
             # Usar configuração personalizada ou padrão
             if custom_config:
-                days_duration = custom_config.get('days_duration', 7)
-                videos_per_day = custom_config.get('videos_per_day', 3)
-                daily_times = custom_config.get('daily_times', ['08:00', '12:00', '18:30'])
-                start_date = custom_config.get('start_date')
+                days_duration, videos_per_day, daily_times, start_date = _CUSTOM_SCHEDULE_KEYS(
+                    {**_CUSTOM_SCHEDULE_DEFAULTS, **custom_config}
+                )
                 
                 self.logger.info(f"Agendando {len(successful_shorts)} shorts:")
                 self.logger.info(f"  • Período: {days_duration} dias")
@@ -568,47 +855,125 @@ class YouTubeAutomation:
             
             # 4. Agendamento e preparação final
             self.logger.log_step("Agendamento e preparação final", 4, 4)
-            
-            # Agendar uploads dos shorts
-            scheduled_ids = self.schedule_shorts_uploads(shorts_created)
-            
-            # Salvar dados da sessão
-            session_data = {
-                'session_id': session_id,
-                'video_data': video_data.to_dict(),
-                'analysis_data': analysis_data,
-                'shorts_created': shorts_created,
-                'scheduled_uploads': scheduled_ids,
-                'upload_system_active': len(scheduled_ids) > 0,
-                'processed_at': datetime.now().isoformat(),
-                'next_steps': ['monitor_uploads', 'check_upload_status'] if scheduled_ids else ['retry_scheduling']
-            }
-            
-            # Salvar em arquivo para próximas etapas
-            session_file = f"temp/session_{session_id}.json"
-            os.makedirs(os.path.dirname(session_file), exist_ok=True)
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
-            
-            self.logger.log_process_end("Processamento Completo", 
-                                      success=True,
-                                      session_file=session_file,
-                                      segments_found=analysis_data.get('segments_found', 0),
-                                      shorts_created=len([s for s in shorts_created if s.get('created_successfully', False)]),
-                                      uploads_scheduled=len(scheduled_ids))
-            
-            return video_data
+            return self._finalize_session(session_id, video_data, analysis_data, shorts_created)
             
         except Exception as e:
-            self.logger.log_process_end("Processamento Completo", 
-                                      success=False, 
-                                      error=str(e))
-            self.logger.log_error_details(e, "Processo completo")
+            self._log_process_failure(e)
             return None
         finally:
             # Limpar recursos
             self.processor.cleanup()
     
+    def _finalize_session(self, session_id: str, video_data: VideoData,
+                          analysis_data: Dict, shorts_created: List[Dict]) -> VideoData:
+        """Agenda uploads, salva dados da sessão e registra o fim do processo"""
+        # Agendar uploads dos shorts
+        scheduled_ids = self.schedule_shorts_uploads(shorts_created)
+        
+        # Salvar dados da sessão
+        session_data = {
+            'session_id': session_id,
+            'video_data': video_data.to_dict(),
+            'analysis_data': analysis_data,
+            'shorts_created': shorts_created,
+            'scheduled_uploads': scheduled_ids,
+            'upload_system_active': len(scheduled_ids) > 0,
+            'processed_at': _iso_now(),
+            'next_steps': ['monitor_uploads', 'check_upload_status'] if scheduled_ids else ['retry_scheduling']
+        }
+        
+        # Salvar em arquivo para próximas etapas
+        session_file = f"temp/session_{session_id}.json"
+        with open(session_file, 'wb') as f:
+            f.write(json_dumps(session_data))
+        
+        self.logger.log_process_end("Processamento Completo", 
+                                  success=True,
+                                  session_file=session_file,
+                                  segments_found=analysis_data.get('segments_found', 0),
+                                  shorts_created=len([s for s in shorts_created if s.get('created_successfully', False)]),
+                                  uploads_scheduled=len(scheduled_ids))
+        
+        return video_data
+    
+    def _log_process_failure(self, error: Exception):
+        """Registra falha do processamento completo"""
+        self.logger.log_process_end("Processamento Completo", 
+                                  success=False, 
+                                  error=str(error))
+        self.logger.log_error_details(error, "Processo completo")
+    
+    def process_videos(self, video_urls: List[str]) -> List[Optional[VideoData]]:
+        """
+        Processa vários vídeos em pipeline: o download do próximo vídeo
+        sobrepõe a análise do atual e a criação de shorts do anterior
+        
+        Args:
+            video_urls: Lista de URLs de vídeos YouTube
+            
+        Returns:
+            Lista de VideoData (None para vídeos que falharam), na ordem das URLs
+        """
+        return asyncio.run(self._process_videos_async(video_urls))
+    
+    async def _process_videos_async(self, video_urls: List[str]) -> List[Optional[VideoData]]:
+        """Pipeline assíncrono download -> análise -> shorts com filas limitadas"""
+        loop = asyncio.get_running_loop()
+        results: List[Optional[VideoData]] = [None] * len(video_urls)
+        downloaded = asyncio.Queue(maxsize=1)
+        analyzed = asyncio.Queue(maxsize=1)
+        
+        def download_item(url: str) -> Optional[VideoData]:
+            try:
+                return self.download_video(url)
+            finally:
+                # O clip carregado só é usado na validação do download
+                self.processor.cleanup()
+        
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='pipeline') as executor:
+            async def run_blocking(func, *args):
+                return await loop.run_in_executor(executor, func, *args)
+            
+            async def download_stage():
+                base_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+                for index, url in enumerate(video_urls):
+                    session_id = f"{base_id}_{index + 1}"
+                    self.logger.log_process_start("Processamento Completo",
+                                                url=url,
+                                                session_id=session_id)
+                    video_data = await run_blocking(download_item, url)
+                    if not video_data:
+                        self._log_process_failure(Exception("Falha no download/validação do vídeo"))
+                        continue
+                    await downloaded.put((index, session_id, video_data))
+                await downloaded.put(None)
+            
+            async def analysis_stage():
+                while (item := await downloaded.get()) is not None:
+                    index, session_id, video_data = item
+                    try:
+                        analysis_data = await run_blocking(self.analyze_video, video_data)
+                    except Exception as e:
+                        self._log_process_failure(e)
+                        continue
+                    await analyzed.put((index, session_id, video_data, analysis_data))
+                await analyzed.put(None)
+            
+            async def shorts_stage():
+                while (item := await analyzed.get()) is not None:
+                    index, session_id, video_data, analysis_data = item
+                    try:
+                        shorts_created = await run_blocking(self.create_shorts, video_data, analysis_data)
+                        results[index] = await run_blocking(
+                            self._finalize_session, session_id, video_data, analysis_data, shorts_created
+                        )
+                    except Exception as e:
+                        self._log_process_failure(e)
+            
+            await asyncio.gather(download_stage(), analysis_stage(), shorts_stage())
+        
+        return results
+    
     def run_upload_monitor(self):
         """
         Executa monitor de upload com dashboard
@@ -631,17 +996,40 @@ class YouTubeAutomation:
             
             # Loop do dashboard
             try:
-                while True:
-                    self.monitor.print_dashboard()
-                    time.sleep(self.monitor.config['dashboard_refresh'])
+                self._run_dashboard()
             except KeyboardInterrupt:
-                self.logger.info("Monitor interrompido pelo usuário")
+                pass
+            self.logger.info("Monitor interrompido pelo usuário")
                 
         except Exception as e:
             self.logger.error(f"Erro no monitor: {str(e)}")
         finally:
             self.stop_all_services()
     
+    def _run_dashboard(self):
+        """Atualiza o dashboard no intervalo configurado até Ctrl+C"""
+        refresh = self.monitor.config['dashboard_refresh']
+        loop = asyncio.new_event_loop()
+        
+        def _tick():
+            self.monitor.print_dashboard()
+            loop.call_later(refresh, _tick)
+        
+        try:
+            # Ctrl+C encerra o loop; onde não há suporte cai no KeyboardInterrupt
+            loop.add_signal_handler(signal.SIGINT, loop.stop)
+            sigint_handled = True
+        except (NotImplementedError, RuntimeError, ValueError):
+            sigint_handled = False
+        
+        try:
+            loop.call_soon(_tick)
+            loop.run_forever()
+        finally:
+            if sigint_handled:
+                loop.remove_signal_handler(signal.SIGINT)
+            loop.close()
+    
     def get_system_status(self) -> Dict:
         """
         Retorna status completo do sistema
@@ -655,7 +1043,7 @@ class YouTubeAutomation:
                 'uploader_status': None,
                 'scheduler_status': None,
                 'monitor_status': None,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _iso_now()
             }
             
             if self.uploader:
@@ -697,6 +1085,13 @@ class YouTubeAutomation:
         except Exception as e:
             self.logger.error(f"Erro ao parar serviços: {str(e)}")
     
+    def release_analysis_worker(self):
+        """Encerra o processo de análise ocioso (recriado sob demanda)"""
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown()
+            self._analysis_pool = None
+            self._analysis_events = None
+    
     def cleanup(self):
         """Limpeza de recursos"""
         try:
@@ -709,13 +1104,143 @@ class YouTubeAutomation:
             
             if hasattr(self, 'downloader'):
                 self.downloader.cleanup_downloads()
+            
+            self.release_analysis_worker()
+            
+            if self._shorts_processor is not None:
+                self._shorts_processor.close()
+                self._shorts_processor = None
+            
+            # Descarregar registros pendentes da fila de logging (sem o QueueHandler,
+            # registros posteriores não se acumulam numa fila que ninguém consome)
+            if self._log_listener is not None:
+                logging.getLogger().removeHandler(self._log_queue_handler)
+                self._log_queue_handler = None
+                self._log_listener.stop()
+                self._log_listener = None
                 
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Erro na limpeza: {str(e)}")
 
+def _process_url(automation: YouTubeAutomation, url: str):
+    if url:
+        print(f"\n🔄 Processando: {url}")
+        result = automation.process_video(url)
+        if result:
+            print(f"✅ Vídeo processado com sucesso: {result.title}")
+        else:
+            print("❌ Falha no processamento do vídeo")
+    else:
+        print("❌ URL inválida")
+
+def _process_urls(automation: YouTubeAutomation, urls: List[str]):
+    valid_urls = [url for url in urls if url]
+    if len(valid_urls) < len(urls):
+        print("❌ URLs vazias ignoradas")
+    
+    print(f"\n🔄 Processando {len(valid_urls)} vídeos em pipeline")
+    results = automation.process_videos(valid_urls)
+    for url, result in zip(valid_urls, results):
+        if result:
+            print(f"✅ Vídeo processado com sucesso: {result.title}")
+        else:
+            print(f"❌ Falha no processamento do vídeo: {url}")
+
+def _menu_process_video(automation: YouTubeAutomation):
+    _process_url(automation, input("Digite a URL do vídeo YouTube: ").strip())
+
+def _menu_upload_monitor(automation: YouTubeAutomation):
+    print("\n📊 Iniciando monitor de upload...")
+    print("Pressione Ctrl+C para parar")
+    automation.run_upload_monitor()
+
+def _menu_advanced_upload(automation: YouTubeAutomation):
+    print("\n🚀 Iniciando sistema avançado de upload...")
+    # O uploader é interativo e o menu volta ao final: só libera o worker de análise
+    automation.release_analysis_worker()
+    try:
+        subprocess.run([sys.executable, "upload_shorts_advanced.py"], check=True)
+    except subprocess.CalledProcessError:
+        print("❌ Erro ao executar sistema avançado de upload")
+    except FileNotFoundError:
+        print("❌ Arquivo upload_shorts_advanced.py não encontrado")
+
+def _menu_initialize_upload(automation: YouTubeAutomation):
+    print("\n🔧 Inicializando sistema de upload...")
+    if automation.initialize_upload_system():
+        print("✅ Sistema de upload inicializado com sucesso")
+    else:
+        print("❌ Falha ao inicializar sistema de upload")
+
+# Rótulos de estado usados no relatório de status: índice False/True
+_ACTIVE_LABELS = ('❌ Inativo', '✅ Ativo')
+_AUTH_LABELS = ('❌ Não autenticado', '✅ Autenticado')
+_RUNNING_LABELS = ('❌ Parado', '✅ Rodando')
+
+def _menu_system_status(automation: YouTubeAutomation):
+    print("\n📋 Status do sistema:")
+    status = automation.get_system_status()
+    if 'error' not in status:
+        uploader = status['uploader_status']
+        sched = status['scheduler_status']
+        mon = status['monitor_status']
+        
+        print(f"Sistema: {_ACTIVE_LABELS[bool(status['system_initialized'])]}")
+        if uploader:
+            print(f"Uploader: {_AUTH_LABELS[bool(uploader['service_authenticated'])]}")
+        if sched:
+            print(f"Scheduler: {_RUNNING_LABELS[bool(sched['is_running'])]}")
+            print(f"Fila de upload: {sched['queue_statistics']['total_items']} itens")
+            
+            # Mostrar próximos uploads se houver
+            upcoming = sched.get('upcoming_uploads', [])
+            if upcoming:
+                print(f"\n📅 Próximos uploads:")
+                for i, upload in enumerate(upcoming[:3], 1):
+                    day_number = upload.get('day_number')
+                    day_info = f"(Dia {day_number}, Slot {upload['time_slot']})" if day_number else ""
+                    print(f"   {i}. {upload['formatted_time']} - {upload['title'][:30]}... {day_info}")
+        
+        if mon:
+            print(f"Monitor: {_RUNNING_LABELS[bool(mon['is_running'])]}")
+    else:
+        print(f"❌ Erro: {status['error']}")
+
+def _menu_validate_system(automation: YouTubeAutomation):
+    validator = SystemValidator()
+    validator.run_full_validation()
+    validator.print_validation_report()
+
+# Opções do menu principal: escolha -> (descrição, ação); None encerra o loop
+MENU = {
+    '1': ("Processar vídeo específico (completo)", _menu_process_video),
+    '2': ("Monitor de upload com dashboard", _menu_upload_monitor),
+    '3': ("Sistema avançado de upload de shorts", _menu_advanced_upload),
+    '4': ("Inicializar sistema de upload", _menu_initialize_upload),
+    '5': ("Verificar status do sistema", _menu_system_status),
+    '6': ("Validar sistema novamente", _menu_validate_system),
+    '7': ("Sair", None),
+}
+
+_MENU_TEXT = "\n📋 MENU PRINCIPAL:\n" + "\n".join(
+    f"{key}. {label}" for key, (label, _) in MENU.items()
+)
+_MENU_PROMPT = f"\nEscolha uma opção (1-{len(MENU)}): "
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos para execução direta, sem o menu interativo"""
+    parser = argparse.ArgumentParser(description="YouTube Shorts Automation - Your_Channel_Name")
+    parser.add_argument('--url', action='append',
+                        help='Processa o vídeo informado e encerra (repita para vários vídeos em pipeline)')
+    parser.add_argument('--status', action='store_true', help='Mostra o status do sistema e encerra')
+    parser.add_argument('--validate', action='store_true', help='Valida o sistema e encerra')
+    parser.add_argument('--init-upload', action='store_true', help='Inicializa o sistema de upload e encerra')
+    return parser.parse_args(argv)
+
 def main():
     """Função principal com menu interativo"""
+    args = _parse_args()
     automation = None
     
     try:
@@ -725,94 +1250,44 @@ def main():
         # Inicializar sistema
         automation = YouTubeAutomation()
         
-        while True:
-            print("\n📋 MENU PRINCIPAL:")
-            print("1. Processar vídeo específico (completo)")
-            print("2. Monitor de upload com dashboard")
-            print("3. Sistema avançado de upload de shorts")
-            print("4. Inicializar sistema de upload")
-            print("5. Verificar status do sistema")
-            print("6. Validar sistema novamente")
-            print("7. Sair")
-            
-            choice = input("\nEscolha uma opção (1-7): ").strip()
-            
-            if choice == '1':
-                url = input("Digite a URL do vídeo YouTube: ").strip()
-                if url:
-                    print(f"\n🔄 Processando: {url}")
-                    result = automation.process_video(url)
-                    if result:
-                        print(f"✅ Vídeo processado com sucesso: {result.title}")
-                    else:
-                        print("❌ Falha no processamento do vídeo")
-                else:
-                    print("❌ URL inválida")
-            
-            elif choice == '2':
-                print("\n📊 Iniciando monitor de upload...")
-                print("Pressione Ctrl+C para parar")
-                automation.run_upload_monitor()
-            
-            elif choice == '3':
-                print("\n🚀 Iniciando sistema avançado de upload...")
-                import subprocess
-                try:
-                    subprocess.run([sys.executable, "upload_shorts_advanced.py"], check=True)
-                except subprocess.CalledProcessError:
-                    print("❌ Erro ao executar sistema avançado de upload")
-                except FileNotFoundError:
-                    print("❌ Arquivo upload_shorts_advanced.py não encontrado")
-            
-            elif choice == '4':
-                print("\n🔧 Inicializando sistema de upload...")
-                if automation.initialize_upload_system():
-                    print("✅ Sistema de upload inicializado com sucesso")
+        # Execução direta via linha de comando: não entra no menu
+        if args.url is not None or args.status or args.validate or args.init_upload:
+            if args.validate:
+                _menu_validate_system(automation)
+            if args.init_upload:
+                _menu_initialize_upload(automation)
+            if args.url is not None:
+                urls = [url.strip() for url in args.url]
+                if len(urls) == 1:
+                    _process_url(automation, urls[0])
                 else:
-                    print("❌ Falha ao inicializar sistema de upload")
-            
-            elif choice == '5':
-                print("\n📋 Status do sistema:")
-                status = automation.get_system_status()
-                if 'error' not in status:
-                    print(f"Sistema: {'✅ Ativo' if status['system_initialized'] else '❌ Inativo'}")
-                    if status['uploader_status']:
-                        auth = status['uploader_status']['service_authenticated']
-                        print(f"Uploader: {'✅ Autenticado' if auth else '❌ Não autenticado'}")
-                    if status['scheduler_status']:
-                        running = status['scheduler_status']['is_running']
-                        print(f"Scheduler: {'✅ Rodando' if running else '❌ Parado'}")
-                        queue_size = status['scheduler_status']['queue_statistics']['total_items']
-                        print(f"Fila de upload: {queue_size} itens")
-                        
-                        # Mostrar próximos uploads se houver
-                        upcoming = status['scheduler_status'].get('upcoming_uploads', [])
-                        if upcoming:
-                            print(f"\n📅 Próximos uploads:")
-                            for i, upload in enumerate(upcoming[:3], 1):
-                                day_info = f"(Dia {upload['day_number']}, Slot {upload['time_slot']})" if upload.get('day_number') else ""
-                                print(f"   {i}. {upload['formatted_time']} - {upload['title'][:30]}... {day_info}")
-                    
-                    if status['monitor_status']:
-                        running = status['monitor_status']['is_running']
-                        print(f"Monitor: {'✅ Rodando' if running else '❌ Parado'}")
-                else:
-                    print(f"❌ Erro: {status['error']}")
+                    _process_urls(automation, urls)
+            if args.status:
+                _menu_system_status(automation)
+            return
+        
+        while True:
+            print(_MENU_TEXT)
+            
+            choice = input(_MENU_PROMPT).strip()
+            option = MENU.get(choice)
             
-            elif choice == '6':
-                validator = SystemValidator()
-                results = validator.run_full_validation()
-                validator.print_validation_report()
+            if option is None:
+                print("❌ Opção inválida")
+                continue
             
-            elif choice == '7':
+            action = option[1]
+            if action is None:
                 print("\n👋 Encerrando sistema...")
                 break
             
-            else:
-                print("❌ Opção inválida")
+            action(automation)
         
     except KeyboardInterrupt:
         print("\n\n🛑 Sistema interrompido pelo usuário")
+    except EOFError:
+        # Entrada encerrada (stdin redirecionado): fim do roteiro de opções
+        print("\n👋 Encerrando sistema...")
     except Exception as e:
         print(f"\n❌ Erro fatal: {str(e)}")
         if automation and automation.logger:
@@ -8,24 +8,27 @@ Canal: Your_Channel_Name
 import os
 import logging
 import re
-from typing import Dict, List, Optional
+import functools
+import itertools
+import contextlib
+import types
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import json
 
-class MetadataGenerator:
-    """Classe para geração automática de metadados dos shorts"""
-    
-    def __init__(self, config: Dict = None):
-        self.logger = logging.getLogger(__name__)
-        
-        # Configurações padrão
-        self.config = config or {
-            'channel_name': 'Your_Channel_Name',
-            'default_hashtags': [
-                '#IA', '#thedreamjob', '#crypto', '#automacao', 
-                '#claudecode', '#shorts', '#tech'
-            ],
-            'description_template': """🎯 {title}
+from json_utils import json_dumps
+
+# Padrões compilados uma única vez para clean_text
+_CLEAN_RE = re.compile(r'[^\w\s\-_.,!?()]')
+_WS_RE = re.compile(r'\s+')
+
+# Configurações padrão
+_DEFAULT_CONFIG = types.MappingProxyType({
+    'channel_name': 'Your_Channel_Name',
+    'default_hashtags': (
+        '#IA', '#thedreamjob', '#crypto', '#automacao', 
+        '#claudecode', '#shorts', '#tech'
+    ),
+    'description_template': """🎯 {title}
 
 📊 Este é um clipe dos melhores momentos do vídeo original!
 
@@ -41,20 +44,65 @@ class MetadataGenerator:
 ---
 💡 Gerado automaticamente com IA
 🤖 Canal: @Your_Channel_Name""",
-            'title_max_length': 100,
-            'description_max_length': 5000,
-            'tags_max_count': 15
-        }
+    'title_max_length': 100,
+    'description_max_length': 5000,
+    'tags_max_count': 15
+})
+
+# Palavras-chave para tags automáticas
+_KEYWORD_TAGS = types.MappingProxyType({
+    'tecnologia': ('tech', 'tecnologia', 'inovacao', 'futuro'),
+    'ia': ('inteligenciaartificial', 'ai', 'machinelearning', 'automacao'),
+    'crypto': ('bitcoin', 'ethereum', 'blockchain', 'criptomoedas'),
+    'negocio': ('empreendedorismo', 'startup', 'business', 'sucesso'),
+    'educacao': ('aprendizado', 'tutorial', 'dicas', 'conhecimento'),
+    'inspiracao': ('motivacao', 'inspiracao', 'mindset', 'crescimento')
+})
+
+# Palavras-chave já em minúsculas, na ordem das categorias
+_KEYWORD_NEEDLES = tuple(
+    (keyword.lower(), keyword)
+    for keywords in _KEYWORD_TAGS.values()
+    for keyword in keywords
+)
+
+# O mesmo segmento é consultado por descrição, tags e qualidade
+@functools.lru_cache(maxsize=256)
+def _match_keywords(keywords_field: str, score_bucket: int) -> Tuple[str, ...]:
+    """Procura as palavras-chave conhecidas no texto do segmento (memoizado)"""
+    keywords_found = []
+    
+    if keywords_field:
+        # Converter para minúsculas uma única vez
+        keywords_lower = keywords_field.lower()
+        keywords_found = [keyword for needle, keyword in _KEYWORD_NEEDLES
+                          if needle in keywords_lower]
+    
+    # Adicionar tags baseadas no score
+    if score_bucket == 2:
+        keywords_found.extend(['viral', 'trending', 'destaque'])
+    elif score_bucket == 1:
+        keywords_found.extend(['interessante', 'relevante'])
+    
+    # Remover duplicatas mantendo ordem
+    return tuple(dict.fromkeys(keywords_found))[:10]  # Limitar a 10 keywords
+
+class MetadataGenerator:
+    """Classe para geração automática de metadados dos shorts"""
+    
+    __slots__ = ('logger', 'config', 'keyword_tags')
+    
+    # Emojis usados para destacar títulos com score alto
+    ENGAGEMENT_EMOJIS = ('🔥', '💡', '🚀', '⚡', '🎯')
+    
+    def __init__(self, config: Dict = None):
+        self.logger = logging.getLogger(__name__)
+        
+        # Configurações padrão compartilhadas (somente leitura) entre instâncias
+        self.config = config or _DEFAULT_CONFIG
         
         # Palavras-chave para tags automáticas
-        self.keyword_tags = {
-            'tecnologia': ['tech', 'tecnologia', 'inovacao', 'futuro'],
-            'ia': ['inteligenciaartificial', 'ai', 'machinelearning', 'automacao'],
-            'crypto': ['bitcoin', 'ethereum', 'blockchain', 'criptomoedas'],
-            'negocio': ['empreendedorismo', 'startup', 'business', 'sucesso'],
-            'educacao': ['aprendizado', 'tutorial', 'dicas', 'conhecimento'],
-            'inspiracao': ['motivacao', 'inspiracao', 'mindset', 'crescimento']
-        }
+        self.keyword_tags = _KEYWORD_TAGS
         
         self.logger.info("MetadataGenerator inicializado")
     
@@ -68,13 +116,8 @@ class MetadataGenerator:
         Returns:
             Texto limpo
         """
-        # Remover caracteres especiais exceto básicos
-        cleaned = re.sub(r'[^\w\s\-_.,!?()]', '', text)
-        
-        # Remover espaços extras
-        cleaned = ' '.join(cleaned.split())
-        
-        return cleaned.strip()
+        # Remover caracteres especiais exceto básicos e colapsar espaços extras
+        return _WS_RE.sub(' ', _CLEAN_RE.sub('', text)).strip()
     
     def generate_title(self, 
                       original_title: str, 
@@ -136,32 +179,12 @@ class MetadataGenerator:
             Lista de palavras-chave encontradas
         """
         try:
-            keywords_found = []
-            
-            # Extrair palavras-chave se disponível
             keywords_field = segment_data.get('keywords', '')
             
-            if keywords_field:
-                # Processar string de keywords
-                for category, keywords in self.keyword_tags.items():
-                    for keyword in keywords:
-                        if keyword.lower() in keywords_field.lower():
-                            keywords_found.append(keyword)
-            
-            # Adicionar tags baseadas no score
             score = segment_data.get('combined_score', 0)
-            if score > 0.8:
-                keywords_found.extend(['viral', 'trending', 'destaque'])
-            elif score > 0.6:
-                keywords_found.extend(['interessante', 'relevante'])
-            
-            # Remover duplicatas mantendo ordem
-            unique_keywords = []
-            for keyword in keywords_found:
-                if keyword not in unique_keywords:
-                    unique_keywords.append(keyword)
+            score_bucket = 2 if score > 0.8 else 1 if score > 0.6 else 0
             
-            return unique_keywords[:10]  # Limitar a 10 keywords
+            return list(_match_keywords(keywords_field, score_bucket))
             
         except Exception as e:
             self.logger.error(f"Erro ao extrair keywords: {str(e)}")
@@ -170,7 +193,8 @@ class MetadataGenerator:
     def generate_description(self, 
                            title: str, 
                            segment_data: Dict,
-                           custom_hashtags: List[str] = None) -> str:
+                           custom_hashtags: List[str] = None,
+                           segment_keywords: List[str] = None) -> str:
         """
         Gera descrição automática para o short
         
@@ -178,16 +202,18 @@ class MetadataGenerator:
             title: Título do short
             segment_data: Dados do segmento
             custom_hashtags: Hashtags customizadas (opcional)
+            segment_keywords: Keywords já extraídas do segmento (opcional)
             
         Returns:
             Descrição formatada
         """
         try:
-            # Usar hashtags customizadas ou padrão
-            hashtags = custom_hashtags or self.config['default_hashtags']
+            # Usar hashtags customizadas ou padrão (cópia local: a lista de origem não é alterada)
+            hashtags = list(custom_hashtags or self.config['default_hashtags'])
             
             # Adicionar hashtags baseadas nas keywords do segmento
-            segment_keywords = self.extract_keywords_from_segment(segment_data)
+            if segment_keywords is None:
+                segment_keywords = self.extract_keywords_from_segment(segment_data)
             for keyword in segment_keywords:
                 hashtag = f"#{keyword}"
                 if hashtag not in hashtags:
@@ -206,15 +232,28 @@ class MetadataGenerator:
             )
             
             # Validar comprimento
-            if len(description) > self.config['description_max_length']:
-                # Reduzir hashtags se necessário
-                while len(description) > self.config['description_max_length'] and len(hashtags) > 5:
-                    hashtags.pop()
-                    hashtags_text = ' '.join(hashtags)
-                    description = self.config['description_template'].format(
-                        title=title.replace(' #Shorts', ''),
-                        hashtags=hashtags_text
-                    )
+            max_length = self.config['description_max_length']
+            if len(description) > max_length and len(hashtags) > 5:
+                # Reduzir hashtags se necessário: o tamanho da descrição é o trecho fixo
+                # do template mais o texto das hashtags (por ocorrência no template)
+                fixed_length = len(self.config['description_template'].format(
+                    title=title.replace(' #Shorts', ''),
+                    hashtags=''
+                ))
+                occurrences = (len(description) - fixed_length) // len(hashtags_text) if hashtags_text else 0
+                
+                # joined_lengths[k - 1] == len(' '.join(hashtags[:k])) + 1
+                joined_lengths = list(itertools.accumulate(len(tag) + 1 for tag in hashtags))
+                keep = len(hashtags)
+                while keep > 5 and fixed_length + occurrences * (joined_lengths[keep - 1] - 1) > max_length:
+                    keep -= 1
+                
+                hashtags = hashtags[:keep]
+                hashtags_text = ' '.join(hashtags)
+                description = self.config['description_template'].format(
+                    title=title.replace(' #Shorts', ''),
+                    hashtags=hashtags_text
+                )
             
             self.logger.debug(f"Descrição gerada: {len(description)} caracteres")
             return description
@@ -225,13 +264,15 @@ class MetadataGenerator:
     
     def generate_tags(self, 
                      title: str, 
-                     segment_data: Dict) -> List[str]:
+                     segment_data: Dict,
+                     segment_keywords: List[str] = None) -> List[str]:
         """
         Gera tags relevantes para o algoritmo do YouTube
         
         Args:
             title: Título do short
             segment_data: Dados do segmento
+            segment_keywords: Keywords já extraídas do segmento (opcional)
             
         Returns:
             Lista de tags otimizadas
@@ -250,7 +291,8 @@ class MetadataGenerator:
             tags.extend(basic_tags)
             
             # Tags baseadas nas keywords do segmento
-            segment_keywords = self.extract_keywords_from_segment(segment_data)
+            if segment_keywords is None:
+                segment_keywords = self.extract_keywords_from_segment(segment_data)
             tags.extend(segment_keywords)
             
             # Tags baseadas no título
@@ -266,12 +308,9 @@ class MetadataGenerator:
                         tags.append(category)
                         break
             
-            # Remover duplicatas e limpar
-            unique_tags = []
-            for tag in tags:
-                clean_tag = self.clean_text(tag.lower())
-                if clean_tag and clean_tag not in unique_tags and len(clean_tag) > 2:
-                    unique_tags.append(clean_tag)
+            # Limpar e remover duplicatas mantendo ordem
+            cleaned_tags = dict.fromkeys(self.clean_text(tag.lower()) for tag in tags)
+            unique_tags = [tag for tag in cleaned_tags if len(tag) > 2]
             
             # Limitar número de tags
             final_tags = unique_tags[:self.config['tags_max_count']]
@@ -288,7 +327,8 @@ class MetadataGenerator:
                                   segment_data: Dict,
                                   part_number: int,
                                   total_parts: int = 7,
-                                  custom_hashtags: List[str] = None) -> Dict:
+                                  custom_hashtags: List[str] = None,
+                                  generated_at: str = None) -> Dict:
         """
         Gera metadados completos para o short
         
@@ -298,6 +338,7 @@ class MetadataGenerator:
             part_number: Número da parte
             total_parts: Total de partes
             custom_hashtags: Hashtags customizadas
+            generated_at: Timestamp ISO de geração (padrão: agora)
             
         Returns:
             Dicionário com metadados completos
@@ -313,15 +354,19 @@ class MetadataGenerator:
                 segment_data.get('keywords', '')
             )
             
+            # Keywords do segmento: extraídas uma vez para descrição, tags e qualidade
+            segment_keywords = self.extract_keywords_from_segment(segment_data)
+            
             # Gerar descrição
             description = self.generate_description(
                 title, 
                 segment_data, 
-                custom_hashtags
+                custom_hashtags,
+                segment_keywords
             )
             
             # Gerar tags
-            tags = self.generate_tags(title, segment_data)
+            tags = self.generate_tags(title, segment_data, segment_keywords)
             
             # Metadados completos
             metadata = {
@@ -337,7 +382,7 @@ class MetadataGenerator:
                     'segment_end': segment_data.get('end_time', 0),
                     'segment_score': segment_data.get('combined_score', 0)
                 },
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': generated_at or datetime.now().isoformat(),
                 'channel': self.config['channel_name']
             }
             
@@ -346,7 +391,7 @@ class MetadataGenerator:
                 'title_length': len(title),
                 'description_length': len(description),
                 'tags_count': len(tags),
-                'has_keywords': len(self.extract_keywords_from_segment(segment_data)) > 0
+                'has_keywords': len(segment_keywords) > 0
             }
             
             self.logger.info(f"Metadados gerados: {title}")
@@ -376,19 +421,23 @@ class MetadataGenerator:
         Returns:
             True se salvou com sucesso
         """
+        # Salvar arquivo JSON: um único write e rename atômico (nunca fica meio escrito)
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
         try:
             # Criar diretório se não existir
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
             
-            # Salvar arquivo JSON
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(metadata))
+            os.replace(tmp_path, output_path)
             
             self.logger.debug(f"Metadados salvos: {output_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Erro ao salvar metadados: {str(e)}")
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
             return False
     
     def generate_batch_metadata(self,
@@ -412,13 +461,17 @@ class MetadataGenerator:
             batch_metadata = []
             total_parts = len(segments_data)
             
+            # Um único horário de geração para todo o lote
+            generated_at = datetime.now().isoformat()
+            
             for i, segment_data in enumerate(segments_data, 1):
                 metadata = self.generate_complete_metadata(
                     original_title,
                     segment_data,
                     i,
                     total_parts,
-                    custom_hashtags
+                    custom_hashtags,
+                    generated_at
                 )
                 batch_metadata.append(metadata)
             
@@ -446,12 +499,11 @@ class MetadataGenerator:
             title = optimized['title']
             
             # Adicionar emojis se não tiver
-            if not any(ord(char) > 127 for char in title):  # Sem emojis
-                engagement_emojis = ['🔥', '💡', '🚀', '⚡', '🎯']
+            if title.isascii():  # Sem emojis
                 if optimized['part_info']['segment_score'] > 0.8:
-                    title = f"{engagement_emojis[0]} {title}"
+                    title = f"{self.ENGAGEMENT_EMOJIS[0]} {title}"
                 elif optimized['part_info']['segment_score'] > 0.6:
-                    title = f"{engagement_emojis[1]} {title}"
+                    title = f"{self.ENGAGEMENT_EMOJIS[1]} {title}"
                 
                 optimized['title'] = title
             
@@ -478,4 +530,4 @@ class MetadataGenerator:
             
         except Exception as e:
             self.logger.error(f"Erro na otimização: {str(e)}")
-            return metadata
\ No newline at end of file
+            return metadata
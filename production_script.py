@@ -8,6 +8,21 @@ import sys
 import os
 from simple_processor import SimpleProcessor
 
+# Formatos suportados: (format_type, nome exibido)
+_NORMAL = ("normal", "Normal (formato original)")
+_SHORTS = ("youtube_shorts", "YouTube Shorts (1080x1920, 9:16)")
+_SCREEN = ("split_screen", "Screen (câmera no topo, tela embaixo)")
+
+# Apelidos aceitos na linha de comando
+_FORMAT_ALIASES = {
+    'normal': _NORMAL, 'n': _NORMAL,
+    'shorts': _SHORTS, 's': _SHORTS, 'youtube_shorts': _SHORTS,
+    'screen': _SCREEN, 'split': _SCREEN, 'split_screen': _SCREEN, 'splitscreen': _SCREEN,
+}
+
+# Opções do menu interativo
+_FORMAT_CHOICES = {'1': _NORMAL, '2': _SCREEN}
+
 def main():
     print("🎬 YOUTUBE SHORTS AUTOMATION - LEONARDO ZARELLI")
     print("=" * 60)
@@ -32,19 +47,12 @@ def main():
     try:
         # Determinar formato
         if format_arg:
-            if format_arg.lower() in ['normal', 'n']:
-                format_type = "normal"
-                format_name = "Normal (formato original)"
-            elif format_arg.lower() in ['shorts', 's', 'youtube_shorts']:
-                format_type = "youtube_shorts"
-                format_name = "YouTube Shorts (1080x1920, 9:16)"
-            elif format_arg.lower() in ['screen', 'split', 'split_screen', 'splitscreen']:
-                format_type = "split_screen"
-                format_name = "Screen (câmera no topo, tela embaixo)"
-            else:
+            fmt = _FORMAT_ALIASES.get(format_arg.lower())
+            if fmt is None:
                 print(f"❌ Formato inválido: {format_arg}")
                 print("💡 Use 'normal' ou 'screen'")
                 sys.exit(1)
+            format_type, format_name = fmt
         else:
             # Menu interativo simplificado para escolher formato
             print("\n📱 ESCOLHA O FORMATO DOS SHORTS:")
@@ -53,16 +61,11 @@ def main():
             
             while True:
                 choice = input("\n👉 Escolha o formato (1 ou 2): ").strip()
-                if choice == "1":
-                    format_type = "normal"
-                    format_name = "Normal (formato original)"
+                fmt = _FORMAT_CHOICES.get(choice)
+                if fmt is not None:
+                    format_type, format_name = fmt
                     break
-                elif choice == "2":
-                    format_type = "split_screen"
-                    format_name = "Screen (câmera no topo, tela embaixo)"
-                    break
-                else:
-                    print("❌ Opção inválida. Digite 1 ou 2")
+                print("❌ Opção inválida. Digite 1 ou 2")
         
         print(f"🎯 URL: {url}")
         print(f"🎬 Criando {num_shorts} shorts")
@@ -6,16 +6,83 @@ Canal: Your_Channel_Name
 """
 
 import os
+import re
+import json
 import logging
-from typing import Dict, List, Optional, Tuple
-from moviepy import (
-    VideoFileClip, TextClip, CompositeVideoClip, 
-    concatenate_videoclips, vfx, afx
-)
-# check_dependencies não existe no MoviePy 2.x+
-import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-import cv2
+import shutil
+import hashlib
+import tempfile
+import functools
+import subprocess
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Arquivos intermediários de renderização (descartáveis como um todo)
+RENDER_TEMP_DIR = "temp/render"
+
+# tmpfs para os MP4 em renderização (o +faststart reescreve o arquivo ao final do encode)
+SHM_DIR = "/dev/shm"
+
+# Encoders H.264 de hardware por backend (ordem de preferência no modo 'auto')
+_GPU_ENCODERS = {
+    'nvenc': 'h264_nvenc',
+    'videotoolbox': 'h264_videotoolbox',
+}
+
+def _crop_box(original_width: int, original_height: int,
+              target_width: int, target_height: int) -> Tuple[int, int, int, int]:
+    """Retângulo (x, y, largura, altura) do crop para a proporção alvo, só com inteiros"""
+    # Comparar proporções por multiplicação cruzada evita divisões em ponto flutuante
+    if original_width * target_height > original_height * target_width:
+        # Vídeo muito largo - crop horizontal mantendo o centro
+        new_width = original_height * target_width // target_height
+        return (original_width - new_width) // 2, 0, new_width, original_height
+    
+    # Vídeo muito alto - crop vertical com foco no terço superior
+    new_height = original_width * target_height // target_width
+    return 0, (original_height - new_height) // 3, original_width, new_height
+
+# Thumbnail: caber em 320x180 mantendo o aspect ratio
+_THUMBNAIL_SCALE = 'scale=320:180:force_original_aspect_ratio=decrease:flags=lanczos'
+
+def _bitrate_bps(value) -> int:
+    """Converte bitrate no formato do ffmpeg ('2M', '128k') para bits/s"""
+    text = str(value).strip().lower()
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * multiplier)
+
+# Caracteres fora de letras/dígitos/'_'/' '/'-' (\w segue str.isalnum + '_')
+_UNSAFE_TITLE_CHARS_RE = re.compile(r'[^\w -]')
+
+# Caracteres que exigiriam escape no filtergraph (ex.: 'C:\Windows\Fonts')
+_FILTER_SPECIAL_CHARS = frozenset(":\\',;[]")
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font_file(pattern: str) -> Optional[str]:
+    """Arquivo da fonte para o padrão fontconfig (resolvido uma vez por processo)"""
+    try:
+        result = subprocess.run(['fc-match', '--format=%{file}', pattern],
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    
+    font_file = result.stdout.strip()
+    if result.returncode != 0 or not font_file or not _FILTER_SPECIAL_CHARS.isdisjoint(font_file):
+        return None
+    return font_file
+
+@functools.lru_cache(maxsize=1)
+def _available_encoders() -> frozenset:
+    """Encoders do ffmpeg instalado (consultado uma vez por processo)"""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return frozenset()
+    
+    return frozenset(
+        fields[1] for fields in map(str.split, result.stdout.splitlines())
+        if len(fields) > 1
+    )
 
 class ShortCreator:
     """Classe para criação automática de shorts formatados"""
@@ -38,248 +105,264 @@ class ShortCreator:
             'text_color': 'white',
             'text_stroke_color': 'black',
             'text_stroke_width': 3,
-            'fade_duration': 0.5
+            'intro_font': 'Arial:bold',  # Padrões fontconfig
+            'hashtag_font': 'Arial',
+            'fade_duration': 0.5,
+            'use_gpu': True,  # Encoder de hardware quando disponível
+            'hwaccel_backend': 'auto',  # auto, nvenc ou videotoolbox
+            'gpu_preset': 'p4',
+            'gpu_cq': 23,
+            'ffmpeg_threads': None  # None = ffmpeg decide (todos os núcleos)
         }
         
         # Verificar dependências
-        self._check_moviepy_dependencies()
+        self._check_ffmpeg_dependencies()
+        
+        # Encoder de hardware detectado uma vez (None = libx264 na CPU)
+        self._gpu_codec = self._detect_gpu_encoder()
+        
+        # Dados do vídeo original por caminho: ((mtime_ns, tamanho), probe)
+        self._source_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+        
+        # Arquivos de texto do drawtext por conteúdo (intro "Parte X/7" e hashtags se repetem)
+        self._text_files: Dict[str, str] = {}
         
         self.logger.info("ShortCreator inicializado")
     
-    def _check_moviepy_dependencies(self):
-        """Verifica se as dependências do MoviePy estão disponíveis"""
-        try:
-            check_dependencies()
-            self.logger.info("Dependências do MoviePy verificadas")
-        except Exception as e:
-            self.logger.warning(f"Algumas dependências podem estar faltando: {str(e)}")
+    def _check_ffmpeg_dependencies(self):
+        """Verifica se ffmpeg e ffprobe estão no PATH"""
+        missing = [tool for tool in ('ffmpeg', 'ffprobe') if shutil.which(tool) is None]
+        if missing:
+            self.logger.warning(f"Algumas dependências podem estar faltando: {', '.join(missing)}")
+        else:
+            self.logger.info("Dependências do ffmpeg verificadas")
     
-    def extract_segment(self, video_path: str, start_time: float, end_time: float) -> VideoFileClip:
+    def _detect_gpu_encoder(self) -> Optional[str]:
+        """Retorna o encoder H.264 de hardware a usar, ou None para CPU"""
+        if not self.config.get('use_gpu', True):
+            return None
+        
+        backend = self.config.get('hwaccel_backend', 'auto')
+        if backend == 'auto':
+            candidates = list(_GPU_ENCODERS.values())
+        else:
+            candidates = [_GPU_ENCODERS.get(backend)]
+        
+        available = _available_encoders()
+        for codec in candidates:
+            if codec in available:
+                self.logger.info(f"Encoder de hardware disponível: {codec}")
+                return codec
+        
+        return None
+    
+    def _encoder_params(self, codec: str) -> List[str]:
+        """Parâmetros do ffmpeg para o encoder de vídeo escolhido"""
+        params = ['-c:v', codec, '-b:v', self.config['video_bitrate']]
+        if self.config.get('ffmpeg_threads'):
+            params += ['-threads', str(self.config['ffmpeg_threads'])]
+        if codec == 'h264_nvenc':
+            params += ['-preset', self.config.get('gpu_preset', 'p4'),
+                       '-rc:v', 'vbr', '-cq', str(self.config.get('gpu_cq', 23))]
+        return params
+    
+    def _run_ffmpeg(self, build_args: Callable[[str], List[str]]):
+        """Executa o ffmpeg, usando o encoder de hardware com fallback para CPU"""
+        codecs = [self._gpu_codec, self.config['video_codec']] if self._gpu_codec else [self.config['video_codec']]
+        
+        for codec in codecs:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-nostdin', '-loglevel', 'error', '-y'] + build_args(codec),
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
+            if result.returncode == 0:
+                return
+            
+            error = result.stderr.strip().splitlines()[-1:] or [f"código {result.returncode}"]
+            if codec != self._gpu_codec:
+                raise Exception(f"ffmpeg falhou: {error[0]}")
+            # Encoder listado mas sem dispositivo utilizável: desativar para os próximos
+            self.logger.warning(f"Falha no encoder {codec}, usando CPU: {error[0]}")
+            self._gpu_codec = None
+    
+    def _probe_video(self, video_path: str) -> Dict:
+        """Lê largura, altura e duração do vídeo com ffprobe (só o cabeçalho)"""
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+             '-show_entries', 'stream=width,height:format=duration',
+             '-of', 'json', video_path],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise Exception(f"ffprobe falhou: {result.stderr.strip()}")
+        
+        probe = json.loads(result.stdout)
+        stream = probe['streams'][0]
+        return {
+            'width': int(stream['width']),
+            'height': int(stream['height']),
+            'duration': float(probe['format']['duration'])
+        }
+    
+    def _get_source_info(self, video_path: str) -> Dict:
+        """Probe do vídeo original, reaproveitado entre as partes do mesmo vídeo"""
+        st = os.stat(video_path)
+        key = (st.st_mtime_ns, st.st_size)
+        
+        cached = self._source_cache.get(video_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        info = self._probe_video(video_path)
+        self._source_cache[video_path] = (key, info)
+        return info
+    
+    def close_source(self, video_path: str):
+        """Descarta os dados em cache do vídeo original após renderizar todas as partes"""
+        self._source_cache.pop(video_path, None)
+    
+    @staticmethod
+    def _clamp_segment(start_time: float, end_time: float, source_duration: float) -> Tuple[float, float]:
+        """Limita o segmento à duração do vídeo original (mínimo de 1s)"""
+        start_time = max(0, min(start_time, source_duration - 1))
+        end_time = max(start_time + 1, min(end_time, source_duration))
+        return start_time, end_time
+    
+    def extract_segment(self, video_path: str, start_time: float, end_time: float,
+                        source_duration: float) -> Tuple[List[str], float]:
         """
-        Extrai segmento específico do vídeo
+        Monta os argumentos de entrada do ffmpeg para o segmento
         
         Args:
             video_path: Caminho do vídeo original
             start_time: Tempo de início em segundos
             end_time: Tempo de fim em segundos
+            source_duration: Duração total do vídeo original
             
         Returns:
-            VideoFileClip do segmento extraído
+            Tupla (argumentos de entrada, duração do segmento)
         """
-        try:
-            self.logger.debug(f"Extraindo segmento: {start_time:.1f}s - {end_time:.1f}s")
-            
-            # Carregar vídeo
-            video = VideoFileClip(video_path)
-            
-            # Validar tempos
-            max_duration = video.duration
-            start_time = max(0, min(start_time, max_duration - 1))
-            end_time = max(start_time + 1, min(end_time, max_duration))
-            
-            # Extrair segmento
-            segment = video.subclip(start_time, end_time)
-            
-            self.logger.debug(f"Segmento extraído: {segment.duration:.1f}s")
-            return segment
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao extrair segmento: {str(e)}")
-            raise
+        start_time, end_time = self._clamp_segment(start_time, end_time, source_duration)
+        duration = end_time - start_time
+        
+        self.logger.debug(f"Extraindo segmento: {start_time:.1f}s - {end_time:.1f}s")
+        
+        # -ss antes de -i: seek no container até o keyframe anterior; como o vídeo é
+        # reencodado, o ffmpeg descarta os frames até o ponto exato (corte preciso sem 2º -ss)
+        return ['-ss', f"{start_time:.3f}", '-t', f"{duration:.3f}", '-i', video_path], duration
     
-    def crop_to_vertical(self, video_clip: VideoFileClip) -> VideoFileClip:
+    def crop_to_vertical(self, original_width: int, original_height: int) -> str:
         """
-        Converte vídeo para formato vertical 9:16 com crop inteligente
+        Monta o filtro de conversão para formato vertical 9:16 com crop inteligente
         
         Args:
-            video_clip: Clip de vídeo original
+            original_width: Largura do vídeo original
+            original_height: Altura do vídeo original
             
         Returns:
-            VideoFileClip no formato 9:16
+            Filtro ffmpeg de crop + redimensionamento
         """
-        try:
-            # Obter dimensões originais
-            original_width, original_height = video_clip.size
-            target_width, target_height = self.config['output_resolution']
-            
-            self.logger.debug(f"Conversão: {original_width}x{original_height} -> {target_width}x{target_height}")
-            
-            # Calcular aspect ratios
-            original_ratio = original_width / original_height
-            target_ratio = target_width / target_height
-            
-            if original_ratio > target_ratio:
-                # Vídeo muito largo - crop horizontal
-                new_width = int(original_height * target_ratio)
-                x_offset = (original_width - new_width) // 2
-                
-                # Crop mantendo o centro
-                cropped = video_clip.crop(x1=x_offset, x2=x_offset + new_width)
-                
-            else:
-                # Vídeo muito alto - crop vertical
-                new_height = int(original_width / target_ratio)
-                y_offset = (original_height - new_height) // 3  # Foco no terço superior
-                
-                # Crop mantendo foco no terço superior
-                cropped = video_clip.crop(y1=y_offset, y2=y_offset + new_height)
-            
-            # Redimensionar para resolução final
-            resized = cropped.resize(self.config['output_resolution'])
-            
-            self.logger.debug("Conversão para formato vertical concluída")
-            return resized
-            
-        except Exception as e:
-            self.logger.error(f"Erro na conversão vertical: {str(e)}")
-            raise
+        target_width, target_height = self.config['output_resolution']
+        
+        self.logger.debug(f"Conversão: {original_width}x{original_height} -> {target_width}x{target_height}")
+        
+        x, y, width, height = _crop_box(original_width, original_height, target_width, target_height)
+        
+        # Crop + redimensionamento para resolução final
+        return f"crop={width}:{height}:{x}:{y},scale={target_width}:{target_height}"
     
-    def create_intro_text(self, part_number: int, total_parts: int = 7) -> TextClip:
+    def _text_file(self, text: str) -> str:
+        """Arquivo com o texto para o drawtext, escrito uma vez por conteúdo"""
+        text_path = self._text_files.get(text)
+        # A limpeza de temp/render pode ter descartado o arquivo desde o último uso
+        if text_path is not None and os.path.exists(text_path):
+            return text_path
+        
+        # Nome derivado do conteúdo: processos do pool compartilham o mesmo arquivo
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+        text_path = f"{RENDER_TEMP_DIR}/text_{digest}.txt"
+        tmp_path = f"{text_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, text_path)
+        
+        self._text_files[text] = text_path
+        return text_path
+    
+    def _drawtext(self, text: str, font: str, font_size: int, stroke_width: int,
+                  y: str, start: float, end: float) -> str:
+        """Filtro drawtext com fade in/out entre start e end"""
+        # Texto via arquivo: dispensa o escape de ':', ',' e aspas do filtergraph
+        text_path = self._text_file(text)
+        
+        # Arquivo de fonte resolvido uma vez; sem fc-match, o ffmpeg busca pelo nome da família
+        font_file = _resolve_font_file(font)
+        font_option = f"fontfile={font_file}" if font_file else f"font={font.split(':')[0]}"
+        
+        fade = self.config['fade_duration']
+        return (
+            f"drawtext=textfile={text_path}:expansion=none:{font_option}"
+            f":fontsize={font_size}:fontcolor={self.config['text_color']}"
+            f":bordercolor={self.config['text_stroke_color']}:borderw={stroke_width}"
+            f":x=(w-text_w)/2:y={y}"
+            f":alpha='min(1,min((t-{start:.3f})/{fade},({end:.3f}-t)/{fade}))'"
+            f":enable='between(t,{start:.3f},{end:.3f})'"
+        )
+    
+    def create_intro_text(self, part_number: int, total_parts: int = 7) -> str:
         """
-        Cria texto de introdução "Parte X/7"
+        Cria filtro do texto de introdução "Parte X/7"
         
         Args:
             part_number: Número da parte (1-7)
             total_parts: Total de partes
             
         Returns:
-            TextClip com texto de introdução
+            Filtro drawtext da introdução (no topo)
         """
-        try:
-            intro_text = f"Parte {part_number}/{total_parts}"
-            
-            # Criar texto com formatação
-            text_clip = TextClip(
-                intro_text,
-                fontsize=self.config['text_font_size'],
-                color=self.config['text_color'],
-                font='Arial-Bold',
-                stroke_color=self.config['text_stroke_color'],
-                stroke_width=self.config['text_stroke_width']
-            ).set_duration(self.config['intro_duration'])
-            
-            # Posicionar no topo
-            text_clip = text_clip.set_position(('center', 50))
-            
-            # Adicionar fade in/out
-            text_clip = text_clip.fadein(self.config['fade_duration']).fadeout(self.config['fade_duration'])
-            
-            self.logger.debug(f"Texto de intro criado: {intro_text}")
-            return text_clip
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao criar intro: {str(e)}")
-            raise
-    
-    def create_hashtag_text(self, hashtags: List[str]) -> TextClip:
-        """
-        Cria texto de hashtags para o rodapé
+        intro_text = f"Parte {part_number}/{total_parts}"
+        self.logger.debug(f"Texto de intro criado: {intro_text}")
         
-        Args:
-            hashtags: Lista de hashtags
-            
-        Returns:
-            TextClip com hashtags
-        """
-        try:
-            # Limitar hashtags e formatar
-            max_hashtags = 5
-            hashtag_text = " ".join(hashtags[:max_hashtags])
-            
-            # Criar texto
-            text_clip = TextClip(
-                hashtag_text,
-                fontsize=self.config['text_font_size'] - 10,  # Menor que intro
-                color=self.config['text_color'],
-                font='Arial',
-                stroke_color=self.config['text_stroke_color'],
-                stroke_width=self.config['text_stroke_width'] - 1
-            ).set_duration(self.config['outro_duration'])
-            
-            # Posicionar no rodapé
-            text_clip = text_clip.set_position(('center', 'bottom')).set_margin(bottom=50)
-            
-            # Adicionar fade in/out
-            text_clip = text_clip.fadein(self.config['fade_duration']).fadeout(self.config['fade_duration'])
-            
-            self.logger.debug(f"Texto de hashtags criado: {hashtag_text}")
-            return text_clip
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao criar hashtags: {str(e)}")
-            raise
+        return self._drawtext(
+            intro_text, self.config.get('intro_font', 'Arial:bold'),
+            self.config['text_font_size'], self.config['text_stroke_width'],
+            '50', 0, self.config['intro_duration']
+        )
     
-    def add_professional_formatting(self, 
-                                  video_clip: VideoFileClip,
-                                  part_number: int,
-                                  hashtags: List[str]) -> VideoFileClip:
+    def create_hashtag_text(self, hashtags: List[str], duration: float) -> str:
         """
-        Adiciona formatação profissional ao short
+        Cria filtro do texto de hashtags para o rodapé
         
         Args:
-            video_clip: Clip de vídeo base
-            part_number: Número da parte
             hashtags: Lista de hashtags
+            duration: Duração do short
             
         Returns:
-            VideoFileClip com formatação aplicada
+            Filtro drawtext das hashtags (no rodapé, ao final)
         """
-        try:
-            self.logger.debug("Aplicando formatação profissional")
-            
-            # Criar elementos de texto
-            intro_text = self.create_intro_text(part_number)
-            hashtag_text = self.create_hashtag_text(hashtags)
-            
-            # Posicionar texto de intro no início
-            intro_text = intro_text.set_start(0)
-            
-            # Posicionar hashtags no final
-            hashtag_text = hashtag_text.set_start(video_clip.duration - self.config['outro_duration'])
-            
-            # Compor vídeo final
-            final_video = CompositeVideoClip([
-                video_clip,
-                intro_text,
-                hashtag_text
-            ])
-            
-            self.logger.debug("Formatação profissional aplicada")
-            return final_video
-            
-        except Exception as e:
-            self.logger.error(f"Erro na formatação: {str(e)}")
-            raise
+        # Limitar hashtags e formatar
+        max_hashtags = 5
+        hashtag_text = " ".join(hashtags[:max_hashtags])
+        self.logger.debug(f"Texto de hashtags criado: {hashtag_text}")
+        
+        return self._drawtext(
+            hashtag_text, self.config.get('hashtag_font', 'Arial'),
+            self.config['text_font_size'] - 10,  # Menor que intro
+            self.config['text_stroke_width'] - 1,
+            'h-text_h-50', max(0, duration - self.config['outro_duration']), duration
+        )
     
-    def optimize_quality(self, video_clip: VideoFileClip) -> VideoFileClip:
+    def optimize_quality(self) -> Optional[str]:
         """
-        Otimiza qualidade do vídeo para shorts
+        Filtro de otimização de qualidade
         
-        Args:
-            video_clip: Clip de vídeo original
-            
         Returns:
-            VideoFileClip otimizado
+            Filtro fps (se configurado) ou None
         """
-        try:
-            self.logger.debug("Otimizando qualidade do vídeo")
-            
-            # Aplicar filtros de melhoria se necessário
-            optimized = video_clip
-            
-            # Ajustar FPS se configurado
-            if self.config['fps'] and self.config['fps'] != video_clip.fps:
-                optimized = optimized.set_fps(self.config['fps'])
-            
-            # Aplicar suavização se necessário
-            # optimized = optimized.fx(vfx.blur, 0.5)  # Blur muito leve se necessário
-            
-            self.logger.debug("Otimização de qualidade concluída")
-            return optimized
-            
-        except Exception as e:
-            self.logger.error(f"Erro na otimização: {str(e)}")
-            return video_clip  # Retornar original em caso de erro
+        # Ajustar FPS se configurado: filtro fps reamostra com PTS corretos antes dos textos
+        if self.config['fps']:
+            return f"fps={self.config['fps']}"
+        return None
     
     def create_short(self,
                     video_path: str,
@@ -287,10 +370,14 @@ class ShortCreator:
                     part_number: int,
                     title: str,
                     hashtags: List[str],
-                    output_dir: str = "shorts") -> Dict:
+                    output_dir: str = "shorts",
+                    create_thumbnail: bool = False) -> Dict:
         """
         Cria um short completo com formatação profissional
         
+        Toda a cadeia (seek, crop, resize, textos e encode) roda em um único
+        processo ffmpeg, sem passar os frames pelo Python.
+        
         Args:
             video_path: Caminho do vídeo original
             segment: Dicionário com start_time, end_time, etc.
@@ -298,6 +385,7 @@ class ShortCreator:
             title: Título base do vídeo
             hashtags: Lista de hashtags
             output_dir: Diretório de saída
+            create_thumbnail: Gerar também a thumbnail (meio do segmento) no mesmo decode
             
         Returns:
             Dicionário com informações do short criado
@@ -307,92 +395,190 @@ class ShortCreator:
             
             # Criar diretório de saída
             os.makedirs(output_dir, exist_ok=True)
+            os.makedirs(RENDER_TEMP_DIR, exist_ok=True)
             
-            # 1. Extrair segmento
-            video_segment = self.extract_segment(
-                video_path, 
-                segment['start_time'], 
-                segment['end_time']
-            )
+            source = self._get_source_info(video_path)
             
-            # 2. Converter para formato vertical
-            vertical_video = self.crop_to_vertical(video_segment)
-            
-            # 3. Adicionar formatação profissional
-            formatted_video = self.add_professional_formatting(
-                vertical_video, 
-                part_number, 
-                hashtags
+            # 1. Extrair segmento
+            input_args, duration = self.extract_segment(
+                video_path,
+                segment['start_time'],
+                segment['end_time'],
+                source['duration']
             )
             
-            # 4. Otimizar qualidade
-            optimized_video = self.optimize_quality(formatted_video)
+            # 2. Converter para formato vertical, 3. otimizar qualidade,
+            # 4. formatação profissional (drawtext no próprio encode, sem composição de clips)
+            video_filters = self._short_filters(source, part_number, hashtags, duration)
+            if create_thumbnail:
+                # Thumbnail como segunda saída do mesmo decode (frame original, antes do crop)
+                filter_graph = (f"[0:v]split=2[src][th];[src]{video_filters}[v];"
+                                f"[th]{self._thumbnail_filter(duration / 2)}[t]")
+            else:
+                filter_graph = f"[0:v]{video_filters}[v]"
             
             # 5. Gerar nome do arquivo
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = f"{safe_title}_Parte_{part_number:02d}.mp4"
-            output_path = os.path.join(output_dir, filename)
+            filename, output_path = self._short_output_path(title, part_number, output_dir)
+            thumbnail_path = self._thumbnail_path(output_path)
             
             # 6. Renderizar vídeo final
             self.logger.info(f"Renderizando: {filename}")
             
-            optimized_video.write_videofile(
-                output_path,
-                codec=self.config['video_codec'],
-                audio_codec=self.config['audio_codec'],
-                bitrate=self.config['video_bitrate'],
-                audio_bitrate=self.config['audio_bitrate'],
-                temp_audiofile='temp/audio_temp.m4a',
-                remove_temp=True,
-                verbose=False,
-                logger=None  # Suprimir logs verbosos
-            )
-            
-            # 7. Limpar recursos
-            optimized_video.close()
-            formatted_video.close()
-            vertical_video.close()
-            video_segment.close()
-            
-            # 8. Validar arquivo criado
-            if not os.path.exists(output_path):
-                raise Exception(f"Arquivo não foi criado: {output_path}")
-            
-            file_size = os.path.getsize(output_path)
-            if file_size < 1024:  # Menor que 1KB indica problema
-                raise Exception(f"Arquivo muito pequeno: {file_size} bytes")
+            # Renderizar fora do destino: o arquivo só aparece em output_dir completo
+            def render(staging_dir: str) -> bool:
+                staged_path = os.path.join(staging_dir, filename)
+                staged_thumbnail = os.path.join(staging_dir, os.path.basename(thumbnail_path))
+                
+                def build_args(codec: str) -> List[str]:
+                    args = input_args + [
+                        '-filter_complex', filter_graph,
+                        '-map', '[v]', '-map', '0:a?',
+                    ] + self._output_params(codec, staged_path)
+                    if create_thumbnail:
+                        args += self._thumbnail_params('[t]', staged_thumbnail)
+                    return args
+                
+                self._run_ffmpeg(build_args)
+                self._publish(staged_path, output_path)
+                return create_thumbnail and self._publish(staged_thumbnail, thumbnail_path)
             
-            # 9. Preparar informações do short
-            short_info = {
-                'part_number': part_number,
-                'filename': filename,
-                'output_path': output_path,
-                'file_size': file_size,
-                'duration': segment['end_time'] - segment['start_time'],
-                'start_time': segment['start_time'],
-                'end_time': segment['end_time'],
-                'title': f"{title} - Parte {part_number}/7 #Shorts",
-                'hashtags': hashtags,
-                'resolution': self.config['output_resolution'],
-                'created_successfully': True
-            }
+            has_thumbnail = self._render_staged(duration, render)
             
-            self.logger.info(f"Short {part_number} criado: {filename} ({file_size/1024/1024:.1f}MB)")
+            # 7. Validar arquivo criado, 8. preparar informações do short
+            short_info = self._short_info(part_number, filename, output_path, segment, title, hashtags)
+            if has_thumbnail:
+                short_info['thumbnail_path'] = thumbnail_path
             return short_info
             
         except Exception as e:
             self.logger.error(f"Erro ao criar short {part_number}: {str(e)}")
-            
-            # Retornar info de falha
-            return {
-                'part_number': part_number,
-                'filename': f"ERROR_Parte_{part_number:02d}.mp4",
-                'output_path': None,
-                'file_size': 0,
-                'duration': 0,
-                'error': str(e),
-                'created_successfully': False
-            }
+            return self._failed_short_info(part_number, e)
+    
+    def _staging_dir(self, total_duration: float) -> str:
+        """Diretório de renderização: tmpfs quando os arquivos cabem nele, senão temp/render"""
+        bps = _bitrate_bps(self.config['video_bitrate']) + _bitrate_bps(self.config['audio_bitrate'])
+        # Margem de 2x: o bitrate configurado é médio, não máximo
+        expected_bytes = 2 * bps * total_duration / 8
+        try:
+            st = os.statvfs(SHM_DIR)
+            if st.f_bavail * st.f_frsize > expected_bytes:
+                return tempfile.mkdtemp(prefix='short_', dir=SHM_DIR)
+        except (OSError, AttributeError):  # Sem /dev/shm (ou sem statvfs, no Windows)
+            pass
+        return tempfile.mkdtemp(prefix='short_', dir=RENDER_TEMP_DIR)
+    
+    def _render_staged(self, total_duration: float, render: Callable[[str], bool]) -> bool:
+        """
+        Executa render(staging_dir) e remove o diretório de renderização
+        
+        A checagem de espaço do tmpfs é feita por worker, então workers
+        simultâneos podem contar com o mesmo espaço livre; se a renderização
+        falhar no tmpfs (ex.: ENOSPC), ela é repetida uma vez em disco.
+        """
+        staging_dir = self._staging_dir(total_duration)
+        try:
+            return render(staging_dir)
+        except Exception as e:
+            if os.path.dirname(staging_dir) != SHM_DIR:
+                raise
+            self.logger.warning(f"Falha ao renderizar em {SHM_DIR}, repetindo em disco: {str(e)}")
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        
+        staging_dir = tempfile.mkdtemp(prefix='short_', dir=RENDER_TEMP_DIR)
+        try:
+            return render(staging_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    def _short_filters(self, source: Dict, part_number: int, hashtags: List[str], duration: float) -> str:
+        """Cadeia de filtros de vídeo de uma parte: crop vertical, fps e textos"""
+        filters = [
+            self.crop_to_vertical(source['width'], source['height']),
+            self.optimize_quality(),
+            self.create_intro_text(part_number),
+            self.create_hashtag_text(hashtags, duration)
+        ]
+        return ",".join(f for f in filters if f)
+    
+    def _short_output_path(self, title: str, part_number: int, output_dir: str) -> Tuple[str, str]:
+        """Nome do arquivo e caminho de saída da parte"""
+        safe_title = _UNSAFE_TITLE_CHARS_RE.sub('', title).rstrip()
+        filename = f"{safe_title}_Parte_{part_number:02d}.mp4"
+        return filename, os.path.join(output_dir, filename)
+    
+    @staticmethod
+    def _thumbnail_path(output_path: str) -> str:
+        """Caminho da thumbnail ao lado do short"""
+        return f"{os.path.splitext(output_path)[0]}_thumb.jpg"
+    
+    @staticmethod
+    def _thumbnail_filter(offset: float) -> str:
+        """Ramo do filtergraph que captura o frame em offset (segundos desde o início da entrada)"""
+        return f"trim=start={offset:.3f},setpts=PTS-STARTPTS,{_THUMBNAIL_SCALE}"
+    
+    @staticmethod
+    def _thumbnail_params(label: str, output_path: str) -> List[str]:
+        """Saída JPEG de um único frame para o ramo de thumbnail"""
+        return ['-map', label, '-frames:v', '1', '-q:v', '3', output_path]
+    
+    @staticmethod
+    def _publish(staged_path: str, output_path: str) -> bool:
+        """Move o arquivo renderizado para o destino; False se o ffmpeg não o gerou"""
+        try:
+            shutil.move(staged_path, output_path)
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def _output_params(self, codec: str, output_path: str) -> List[str]:
+        """Parâmetros de encode e arquivo de uma saída do ffmpeg"""
+        return self._encoder_params(codec) + [
+            '-c:a', self.config['audio_codec'],
+            '-b:a', self.config['audio_bitrate'],
+            '-movflags', '+faststart', output_path
+        ]
+    
+    def _short_info(self, part_number: int, filename: str, output_path: str,
+                    segment: Dict, title: str, hashtags: List[str]) -> Dict:
+        """Valida o arquivo renderizado e monta as informações do short"""
+        try:
+            file_size = os.stat(output_path).st_size
+        except FileNotFoundError:
+            raise Exception(f"Arquivo não foi criado: {output_path}")
+        
+        if file_size < 1024:  # Menor que 1KB indica problema
+            raise Exception(f"Arquivo muito pequeno: {file_size} bytes")
+        
+        short_info = {
+            'part_number': part_number,
+            'filename': filename,
+            'output_path': output_path,
+            'file_size': file_size,
+            'duration': segment['end_time'] - segment['start_time'],
+            'start_time': segment['start_time'],
+            'end_time': segment['end_time'],
+            'title': f"{title} - Parte {part_number}/7 #Shorts",
+            'hashtags': hashtags,
+            'resolution': self.config['output_resolution'],
+            'created_successfully': True
+        }
+        
+        self.logger.info(f"Short {part_number} criado: {filename} ({file_size/1024/1024:.1f}MB)")
+        return short_info
+    
+    @staticmethod
+    def _failed_short_info(part_number: int, error: Exception) -> Dict:
+        """Informações de um short que falhou"""
+        return {
+            'part_number': part_number,
+            'filename': f"ERROR_Parte_{part_number:02d}.mp4",
+            'output_path': None,
+            'file_size': 0,
+            'duration': 0,
+            'error': str(error),
+            'created_successfully': False
+        }
     
     def generate_thumbnail(self, video_path: str, timestamp: float, output_path: str) -> bool:
         """
@@ -407,33 +593,20 @@ class ShortCreator:
             True se gerou com sucesso
         """
         try:
-            # Usar OpenCV para capturar frame
-            cap = cv2.VideoCapture(video_path)
-            
-            # Ir para o timestamp
-            cap.set(cv2.CAP_PROP_POS_MSEC, timestamp * 1000)
-            
-            # Capturar frame
-            ret, frame = cap.read()
-            cap.release()
+            # -ss antes de -i: seek no keyframe, sem decodificar o vídeo até o timestamp
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-nostdin', '-loglevel', 'error', '-y',
+                 '-ss', f"{timestamp:.3f}", '-i', video_path, '-frames:v', '1',
+                 '-vf', _THUMBNAIL_SCALE,
+                 '-q:v', '3', output_path],
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
             
-            if ret:
-                # Converter BGR para RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Criar imagem PIL
-                image = Image.fromarray(frame_rgb)
-                
-                # Redimensionar para thumbnail (mantendo aspect ratio)
-                image.thumbnail((320, 180), Image.Resampling.LANCZOS)
-                
-                # Salvar
-                image.save(output_path, 'JPEG', quality=85)
-                
+            if result.returncode == 0 and os.path.exists(output_path):
                 self.logger.debug(f"Thumbnail gerada: {output_path}")
                 return True
             else:
-                self.logger.warning(f"Não foi possível capturar frame em {timestamp}s")
+                self.logger.warning(f"Não foi possível capturar frame em {timestamp}s: {result.stderr.strip()}")
                 return False
                 
         except Exception as e:
@@ -463,7 +636,9 @@ class ShortCreator:
             warnings = []
             
             # Verificar se arquivo existe
-            if not os.path.exists(output_path):
+            try:
+                os.stat(output_path)
+            except FileNotFoundError:
                 issues.append('Arquivo não encontrado')
                 return {'is_valid': False, 'issues': issues, 'warnings': warnings}
             
@@ -483,19 +658,27 @@ class ShortCreator:
             elif duration > max_duration:
                 warnings.append(f'Duração longa: {duration:.1f}s (máx: {max_duration}s)')
             
-            # Tentar abrir vídeo para validação técnica
+            # Validação técnica pelo cabeçalho do arquivo (ffprobe não inicializa decoders)
             try:
-                test_clip = VideoFileClip(output_path)
+                result = subprocess.run(
+                    ['ffprobe', '-v', 'error', '-show_entries', 'stream=codec_type,width,height',
+                     '-of', 'json', output_path],
+                    capture_output=True, text=True
+                )
+                if result.returncode != 0:
+                    raise Exception(result.stderr.strip() or f"ffprobe código {result.returncode}")
+                
+                streams = json.loads(result.stdout).get('streams', [])
+                video_stream = next((s for s in streams if s.get('codec_type') == 'video'), None)
                 
                 # Verificar se tem áudio
-                if test_clip.audio is None:
+                if not any(s.get('codec_type') == 'audio' for s in streams):
                     warnings.append('Vídeo sem áudio')
                 
                 # Verificar resolução
-                if test_clip.size != tuple(self.config['output_resolution']):
-                    issues.append(f'Resolução incorreta: {test_clip.size}')
-                
-                test_clip.close()
+                size = (video_stream['width'], video_stream['height']) if video_stream else None
+                if size != tuple(self.config['output_resolution']):
+                    issues.append(f'Resolução incorreta: {size}')
                 
             except Exception as e:
                 issues.append(f'Erro ao validar arquivo: {str(e)}')
@@ -8,17 +8,102 @@ Canal: Your_Channel_Name
 import os
 import json
 import logging
+import logging.handlers
 import time
 import threading
+import functools
+import multiprocessing
 from typing import Dict, List, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 import shutil
+import fnmatch
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem reflink, backup por cópia
+    fcntl = None
 
 # Importar módulos locais
-from short_creator import ShortCreator
+from short_creator import ShortCreator, RENDER_TEMP_DIR
 from metadata_generator import MetadataGenerator
 
+def _default_parallel_jobs() -> int:
+    """Workers de renderização: SHORTS_MAX_WORKERS ou até 4 núcleos (limita RAM)"""
+    env_value = os.environ.get('SHORTS_MAX_WORKERS')
+    if env_value:
+        return max(1, int(env_value))
+    return max(1, min(os.cpu_count() or 1, 4))
+
+# Limpeza de temp/: lixeiras de renderização (render.trash.*) e arquivos soltos
+_TEMP_DIR, _RENDER_DIR_NAME = os.path.split(RENDER_TEMP_DIR)
+_TRASH_PREFIX = f"{_RENDER_DIR_NAME}.trash."
+_TEMP_FILE_PATTERNS = ('*.tmp',)
+
+# Tamanho do vídeo e espaço livre reaproveitados por alguns segundos entre validações repetidas
+VALIDATION_STAT_TTL = 5
+
+def _stat_bucket() -> int:
+    """Janela de tempo atual do cache de validação"""
+    return int(time.monotonic() // VALIDATION_STAT_TTL)
+
+@functools.lru_cache(maxsize=32)
+def _file_size_bucket(path: str, bucket: int) -> int:
+    """Tamanho do arquivo, memoizado por janela de tempo"""
+    return os.path.getsize(path)
+
+@functools.lru_cache(maxsize=8)
+def _disk_free_bucket(path: str, bucket: int) -> int:
+    """Espaço livre do disco, memoizado por janela de tempo"""
+    import psutil
+    return psutil.disk_usage(path).free
+
+# ioctl FICLONE do Linux (reflink em btrfs/xfs)
+_FICLONE = 0x40049409
+
+def _fast_clone(src: str, dst: str) -> str:
+    """Copia src em dst por reflink quando possível (sem copiar os dados); retorna o método usado"""
+    # Reflink: blocos compartilhados com copy-on-write, mas um arquivo independente
+    # (hardlink não serve: o backup dividiria o inode com o original)
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            shutil.copystat(src, dst)
+            return 'reflink'
+        except OSError:
+            try:
+                os.remove(dst)
+            except OSError:
+                pass
+    
+    shutil.copy2(src, dst)
+    return 'cópia'
+
+def _index_output_files(paths: List[str]) -> Dict[str, int]:
+    """Tamanho de cada arquivo existente em paths, com um scandir por diretório"""
+    wanted_by_dir: Dict[str, set] = {}
+    for path in paths:
+        wanted_by_dir.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+    
+    sizes = {}
+    for directory, wanted in wanted_by_dir.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    # stat só dos shorts do lote: o diretório acumula shorts de outros vídeos
+                    if entry.name in wanted and entry.is_file():
+                        sizes[os.path.join(directory, entry.name)] = entry.stat().st_size
+        except FileNotFoundError:
+            pass
+    return sizes
+
+def _remove_trees(paths: List[str]):
+    """Remove diretórios descartados (executado fora da thread principal)"""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
 class ShortsQualityController:
     """Controlador de qualidade para shorts"""
     
@@ -40,12 +125,16 @@ class ShortsQualityController:
             issues = []
             warnings = []
             
+            bucket = _stat_bucket()
+            
             # Verificar arquivo de vídeo
-            if not os.path.exists(video_path):
+            try:
+                file_size = _file_size_bucket(video_path, bucket)
+            except FileNotFoundError:
                 issues.append(f"Vídeo não encontrado: {video_path}")
             else:
                 # Verificar tamanho do arquivo
-                file_size_gb = os.path.getsize(video_path) / (1024**3)
+                file_size_gb = file_size / (1024**3)
                 if file_size_gb > 10:
                     warnings.append(f"Arquivo muito grande: {file_size_gb:.1f}GB")
                 elif file_size_gb < 0.01:
@@ -71,8 +160,7 @@ class ShortsQualityController:
             
             # Verificar espaço em disco
             try:
-                import psutil
-                disk_free_gb = psutil.disk_usage('.').free / (1024**3)
+                disk_free_gb = _disk_free_bucket('.', bucket) / (1024**3)
                 estimated_output_size = len(segments) * 0.5  # Estimativa: 500MB por short
                 
                 if disk_free_gb < estimated_output_size * 2:  # Margem de segurança
@@ -112,12 +200,16 @@ class ShortsQualityController:
             failed = []
             warnings = []
             
+            file_sizes = _index_output_files([
+                short_info['output_path'] for short_info in shorts_info
+                if short_info.get('created_successfully', False) and short_info.get('output_path')
+            ])
+            
             for short_info in shorts_info:
                 if short_info.get('created_successfully', False):
                     # Verificar se arquivo existe e tem tamanho adequado
-                    output_path = short_info.get('output_path')
-                    if output_path and os.path.exists(output_path):
-                        file_size = os.path.getsize(output_path)
+                    file_size = file_sizes.get(short_info.get('output_path'))
+                    if file_size is not None:
                         if file_size > 1024 * 1024:  # Maior que 1MB
                             successful.append(short_info)
                         else:
@@ -154,7 +246,7 @@ class ShortsBatchProcessor:
             'output_dir': 'shorts',
             'backup_original': True,
             'backup_dir': 'backup',
-            'max_parallel_jobs': 2,
+            'max_parallel_jobs': _default_parallel_jobs(),
             'recovery_enabled': True,
             'progress_callback': None,
             'create_thumbnails': True,
@@ -179,8 +271,60 @@ class ShortsBatchProcessor:
         # Lock para thread safety
         self._state_lock = threading.Lock()
         
+        # Pool de renderização reaproveitado entre lotes (workers spawn são caros de iniciar)
+        self._render_pool = None
+        self._render_pool_key = None
+        self._render_pool_lock = threading.Lock()
+        self._render_log_listener = None
+        
         self.logger.info("ShortsBatchProcessor inicializado")
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _get_render_pool(self, max_workers: int, worker_config: Dict) -> ProcessPoolExecutor:
+        """Pool de workers de renderização, recriado só se o tamanho ou a config mudarem"""
+        key = (max_workers, worker_config)
+        with self._render_pool_lock:
+            if self._render_pool is not None and self._render_pool_key != key:
+                self._shutdown_render_pool()
+            
+            if self._render_pool is None:
+                # spawn: evita herdar leitores ffmpeg/threads do processo pai via fork
+                context = multiprocessing.get_context('spawn')
+                
+                # Logs dos workers voltam por uma fila e são tratados pelos handlers deste processo
+                log_queue = context.Queue()
+                self._render_log_listener = logging.handlers.QueueListener(log_queue, _WorkerLogRelay())
+                self._render_log_listener.start()
+                
+                self._render_pool = ProcessPoolExecutor(max_workers=max_workers,
+                                                        mp_context=context,
+                                                        initializer=_init_short_worker,
+                                                        initargs=(worker_config, log_queue,
+                                                                  logging.getLogger().level))
+                self._render_pool_key = key
+            return self._render_pool
+    
+    def _shutdown_render_pool(self):
+        """Encerra o pool e, depois dele, o relay de logs (chamado com o lock do pool)"""
+        if self._render_pool is not None:
+            self._render_pool.shutdown()
+            self._render_pool = None
+            self._render_pool_key = None
+        
+        if self._render_log_listener is not None:
+            self._render_log_listener.stop()
+            self._render_log_listener = None
+    
+    def close(self):
+        """Encerra os workers de renderização ociosos (recriados sob demanda)"""
+        with self._render_pool_lock:
+            self._shutdown_render_pool()
+    
     def _update_progress(self, step: str, current: int, total: int, details: str = ""):
         """Atualiza estado do progresso"""
         with self._state_lock:
@@ -239,7 +383,8 @@ class ShortsBatchProcessor:
             backup_path = os.path.join(backup_dir, backup_filename)
             
             self.logger.info(f"Criando backup: {backup_path}")
-            shutil.copy2(video_path, backup_path)
+            method = _fast_clone(video_path, backup_path)
+            self.logger.debug(f"Backup criado por {method}")
             
             return backup_path
             
@@ -271,36 +416,62 @@ class ShortsBatchProcessor:
         try:
             self.logger.info(f"Processando short {part_number}")
             
-            # Criar diretório de saída
+            # Criar short (create_short garante o diretório de saída)
             output_dir = self.config['output_dir']
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Criar short
             short_info = self.short_creator.create_short(
                 video_path=video_path,
                 segment=segment,
                 part_number=part_number,
                 title=title,
                 hashtags=hashtags,
-                output_dir=output_dir
+                output_dir=output_dir,
+                create_thumbnail=self.config['create_thumbnails']
             )
             
+            return self._finalize_short(short_info, video_path, segment, metadata)
+            
+        except Exception as e:
+            self.logger.error(f"Erro ao processar short {part_number}: {str(e)}")
+            return {
+                'part_number': part_number,
+                'created_successfully': False,
+                'error': str(e),
+                'metadata': metadata
+            }
+    
+    def _finalize_short(self,
+                        short_info: Dict,
+                        video_path: str,
+                        segment: Dict,
+                        metadata: Dict) -> Dict:
+        """Valida o short renderizado, gera thumbnail e salva metadados"""
+        try:
             # Validar qualidade
             if short_info.get('created_successfully', False):
                 validation = self.short_creator.validate_short_quality(short_info)
                 short_info['validation'] = validation
                 
-                # Criar thumbnail se configurado
+                # Caminhos derivados do short (splitext: '.mp4' em diretórios não interfere)
+                base_path = os.path.splitext(short_info['output_path'])[0]
+                
+                # Criar thumbnail se configurado (normalmente já gerada no encode do short)
                 if self.config['create_thumbnails'] and validation['is_valid']:
-                    thumbnail_path = short_info['output_path'].replace('.mp4', '_thumb.jpg')
-                    middle_time = (segment['start_time'] + segment['end_time']) / 2
-                    
-                    if self.short_creator.generate_thumbnail(video_path, middle_time, thumbnail_path):
-                        short_info['thumbnail_path'] = thumbnail_path
+                    if 'thumbnail_path' not in short_info:
+                        thumbnail_path = f"{base_path}_thumb.jpg"
+                        middle_time = (segment['start_time'] + segment['end_time']) / 2
+                        
+                        if self.short_creator.generate_thumbnail(video_path, middle_time, thumbnail_path):
+                            short_info['thumbnail_path'] = thumbnail_path
+                elif 'thumbnail_path' in short_info:
+                    # Short inválido: descartar a thumbnail gerada junto com o encode
+                    try:
+                        os.remove(short_info.pop('thumbnail_path'))
+                    except OSError:
+                        pass
                 
                 # Salvar metadados se configurado
                 if self.config['save_metadata_files']:
-                    metadata_path = short_info['output_path'].replace('.mp4', '_metadata.json')
+                    metadata_path = f"{base_path}_metadata.json"
                     self.metadata_generator.save_metadata_file(metadata, metadata_path)
                     short_info['metadata_path'] = metadata_path
             
@@ -310,6 +481,7 @@ class ShortsBatchProcessor:
             return short_info
             
         except Exception as e:
+            part_number = short_info.get('part_number')
             self.logger.error(f"Erro ao processar short {part_number}: {str(e)}")
             return {
                 'part_number': part_number,
@@ -343,50 +515,63 @@ class ShortsBatchProcessor:
                 title, segments, hashtags
             )
             
-            # Processar shorts em paralelo
+            # Renderizar shorts em processos separados (cada worker conduz seu próprio ffmpeg)
             shorts_results = []
-            max_workers = min(self.config['max_parallel_jobs'], len(segments))
+            max_workers = self.config['max_parallel_jobs']
+            output_dir = self.config['output_dir']  # Criado por create_short em cada worker
+            
+            # Dividir os núcleos entre os encodes simultâneos (cada ffmpeg usa todos por padrão)
+            worker_config = dict(self.short_creator.config)
+            if not worker_config.get('ffmpeg_threads'):
+                worker_config['ffmpeg_threads'] = max(1, (os.cpu_count() or 1) // max_workers)
+            
+            # Pool com o tamanho configurado (não o do lote) para ser reaproveitado entre vídeos
+            executor = self._get_render_pool(max_workers, worker_config)
+            
+            # Submeter tarefas
+            future_to_part = {}
             
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submeter tarefas
-                future_to_part = {}
+            for i, (segment, metadata) in enumerate(zip(segments, batch_metadata), 1):
+                future = executor.submit(
+                    _create_short_worker,
+                    (video_path, segment, i, title, hashtags, output_dir,
+                     self.config['create_thumbnails'])
+                )
+                future_to_part[future] = (i, segment, metadata)
+            
+            # Coletar resultados (validação/thumbnail/metadados no processo pai)
+            completed = 0
+            for future in as_completed(future_to_part):
+                part_number, segment, metadata = future_to_part[future]
                 
-                for i, (segment, metadata) in enumerate(zip(segments, batch_metadata), 1):
-                    future = executor.submit(
-                        self.process_single_short,
-                        video_path, segment, i, title, hashtags, metadata
+                try:
+                    result = self._finalize_short(future.result(), video_path, segment, metadata)
+                    shorts_results.append(result)
+                    
+                    completed += 1
+                    self._update_progress(
+                        "Criando shorts", 
+                        completed, 
+                        len(segments),
+                        f"Short {part_number} concluído"
                     )
-                    future_to_part[future] = i
-                
-                # Coletar resultados
-                completed = 0
-                for future in as_completed(future_to_part):
-                    part_number = future_to_part[future]
                     
-                    try:
-                        result = future.result()
-                        shorts_results.append(result)
-                        
-                        completed += 1
-                        self._update_progress(
-                            "Criando shorts", 
-                            completed, 
-                            len(segments),
-                            f"Short {part_number} concluído"
-                        )
-                        
-                        if result.get('created_successfully', False):
-                            self.logger.info(f"✓ Short {part_number} criado com sucesso")
-                        else:
-                            self.logger.error(f"✗ Falha no short {part_number}: {result.get('error', 'Erro desconhecido')}")
+                    if result.get('created_successfully', False):
+                        self.logger.info(f"✓ Short {part_number} criado com sucesso")
+                    else:
+                        self.logger.error(f"✗ Falha no short {part_number}: {result.get('error', 'Erro desconhecido')}")
+                
+                except Exception as e:
+                    self.logger.error(f"Erro no processamento paralelo (parte {part_number}): {str(e)}")
+                    shorts_results.append({
+                        'part_number': part_number,
+                        'created_successfully': False,
+                        'error': str(e)
+                    })
                     
-                    except Exception as e:
-                        self.logger.error(f"Erro no processamento paralelo (parte {part_number}): {str(e)}")
-                        shorts_results.append({
-                            'part_number': part_number,
-                            'created_successfully': False,
-                            'error': str(e)
-                        })
+                    # Worker morreu: o pool fica inutilizável e é recriado no próximo lote
+                    if isinstance(e, BrokenProcessPool):
+                        self.close()
             
             # Ordenar resultados por número da parte
             shorts_results.sort(key=lambda x: x.get('part_number', 0))
@@ -395,6 +580,8 @@ class ShortsBatchProcessor:
             
         except Exception as e:
             self.logger.error(f"Erro no processamento paralelo: {str(e)}")
+            if isinstance(e, BrokenProcessPool):
+                self.close()
             raise
     
     def process_batch_sequential(self,
@@ -444,6 +631,7 @@ class ShortsBatchProcessor:
                 else:
                     self.logger.error(f"✗ Falha no short {i}: {result.get('error', 'Erro desconhecido')}")
             
+            self.short_creator.close_source(video_path)
             return shorts_results
             
         except Exception as e:
@@ -559,16 +747,37 @@ class ShortsBatchProcessor:
     def cleanup_temp_files(self):
         """Limpa arquivos temporários"""
         try:
-            temp_patterns = ['temp/audio_temp.m4a', 'temp/*.tmp']
-            
-            for pattern in temp_patterns:
-                import glob
-                for temp_file in glob.glob(pattern):
-                    try:
-                        os.remove(temp_file)
-                        self.logger.debug(f"Arquivo temporário removido: {temp_file}")
-                    except:
-                        pass
+            # Diretório de renderização: rename imediato e remoção em background
+            trash_dir = f"{RENDER_TEMP_DIR}.trash.{os.getpid()}.{time.time_ns()}"
+            try:
+                os.rename(RENDER_TEMP_DIR, trash_dir)
+                os.makedirs(RENDER_TEMP_DIR, exist_ok=True)
+            except FileNotFoundError:
+                pass
+            
+            # Uma listagem de temp/ para lixeiras (inclusive de execuções interrompidas) e .tmp
+            trash_dirs = []
+            temp_files = []
+            try:
+                with os.scandir(_TEMP_DIR) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(_TRASH_PREFIX) and entry.is_dir(follow_symlinks=False):
+                            trash_dirs.append(entry.path)
+                        elif (any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in _TEMP_FILE_PATTERNS)
+                              and entry.is_file(follow_symlinks=False)):
+                            temp_files.append(entry.path)
+            except FileNotFoundError:
+                pass
+            
+            if trash_dirs:
+                threading.Thread(target=_remove_trees, args=(trash_dirs,), daemon=True).start()
+            
+            for temp_file in temp_files:
+                try:
+                    os.remove(temp_file)
+                    self.logger.debug(f"Arquivo temporário removido: {temp_file}")
+                except:
+                    pass
                         
         except Exception as e:
             self.logger.warning(f"Erro na limpeza: {str(e)}")
@@ -613,4 +822,25 @@ class ShortsBatchProcessor:
             return report_text
             
         except Exception as e:
-            return f"Erro ao gerar relatório: {str(e)}"
\ No newline at end of file
+            return f"Erro ao gerar relatório: {str(e)}"
+
+# Criador de shorts de cada processo do pool de renderização (criado uma vez por worker)
+_worker_creator = None
+
+class _WorkerLogRelay(logging.Handler):
+    """Repassa os registros dos workers aos loggers de mesmo nome no processo principal"""
+    
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
+
+def _init_short_worker(config: Dict, log_queue, log_level: int):
+    """Inicializa o processo worker, encaminhando logs para o processo principal"""
+    global _worker_creator
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(log_level)
+    _worker_creator = ShortCreator(config)
+
+def _create_short_worker(args: tuple) -> Dict:
+    """Renderiza um short dentro do processo worker"""
+    return _worker_creator.create_short(*args)
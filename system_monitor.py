@@ -10,11 +10,24 @@ import time
 import json
 import logging
 import threading
+import functools
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import psutil
 from dataclasses import dataclass
 
+# Uso de disco é reaproveitado por alguns segundos entre consultas repetidas
+DISK_USAGE_TTL = 5
+
+@functools.lru_cache(maxsize=1)
+def _disk_usage_bucket(path: str, bucket: int):
+    """statvfs do caminho, memoizado por janela de tempo"""
+    return psutil.disk_usage(path)
+
+def _disk_usage(path: str = '.'):
+    """Uso de disco com cache de DISK_USAGE_TTL segundos"""
+    return _disk_usage_bucket(path, int(time.monotonic() // DISK_USAGE_TTL))
+
 @dataclass
 class SystemStatus:
     """Status do sistema em tempo real"""
@@ -121,7 +134,7 @@ class SystemMonitor:
             
             # Salvar arquivo
             with open(self.config['history_file'], 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(data, indent=2, ensure_ascii=False))
                 
         except Exception as e:
             self.logger.error(f"Erro ao salvar histórico: {str(e)}")
@@ -134,7 +147,7 @@ class SystemMonitor:
             memory = psutil.virtual_memory()
             
             # Disco
-            disk = psutil.disk_usage('.')
+            disk = _disk_usage('.')
             disk_free_gb = disk.free / (1024**3)
             
             # Threads ativas
@@ -10,10 +10,20 @@ import sys
 import json
 import shutil
 import logging
+import functools
 import subprocess
+import importlib.util
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
+@functools.lru_cache(maxsize=None)
+def _package_installed(package_name: str) -> bool:
+    """Verifica se o pacote está instalado sem importá-lo (resultado memoizado)"""
+    try:
+        return importlib.util.find_spec(package_name) is not None
+    except (ImportError, ValueError):
+        return False
+
 class SystemValidator:
     """Classe para validar configurações e dependências do sistema"""
     
@@ -78,7 +88,6 @@ class SystemValidator:
             ('speech_recognition', 'SpeechRecognition'),
             ('pydub', 'PyDub'),
             ('numpy', 'NumPy'),
-            ('schedule', 'Schedule'),
             ('requests', 'Requests')
         ]
         
@@ -86,11 +95,10 @@ class SystemValidator:
         installed_packages = []
         
         for package_name, display_name in required_packages:
-            try:
-                __import__(package_name)
+            if _package_installed(package_name):
                 installed_packages.append(display_name)
                 self.logger.debug(f"Dependência OK: {display_name}")
-            except ImportError:
+            else:
                 missing_packages.append(display_name)
                 self.logger.warning(f"Dependência faltando: {display_name}")
         
@@ -8,11 +8,11 @@ Canal: Your_Channel_Name
 import os
 import json
 import logging
-import schedule
 import time
 import threading
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -286,6 +286,14 @@ class UploadScheduler:
             'retry_delay_hours': 4
         }
         
+        # Fuso da limpeza diária (None: horário local se o configurado for inválido)
+        timezone_name = self.config.get('timezone', 'America/Sao_Paulo')
+        try:
+            self._tz = ZoneInfo(timezone_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            self.logger.warning(f"Fuso horário inválido '{timezone_name}', usando horário local")
+            self._tz = None
+        
         # Componentes
         self.queue = UploadQueue()
         self.uploader = None  # Será definido posteriormente
@@ -529,12 +537,6 @@ class UploadScheduler:
             self.is_running = True
             self._stop_event.clear()
             
-            # Configurar schedule
-            schedule.every(self.config['check_interval']).seconds.do(self.process_pending_uploads)
-            
-            # Configurar limpeza diária
-            schedule.every().day.at("02:00").do(self.queue.cleanup_completed)
-            
             # Iniciar thread
             self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
             self.scheduler_thread.start()
@@ -545,17 +547,41 @@ class UploadScheduler:
             self.logger.error(f"Erro ao iniciar scheduler: {str(e)}")
             self.is_running = False
     
+    def _next_cleanup_time(self) -> float:
+        """Próxima limpeza diária (02:00 no fuso configurado) como timestamp UTC"""
+        now = datetime.now(self._tz)
+        next_run = now.replace(hour=2, minute=0, second=0, microsecond=0)
+        if next_run <= now:
+            next_run = (now + timedelta(days=1)).replace(hour=2, minute=0, second=0, microsecond=0)
+        return next_run.timestamp()
+    
     def _run_scheduler(self):
         """Loop principal do scheduler"""
         self.logger.info("Loop do scheduler iniciado")
         
+        check_interval = self.config['check_interval']
+        next_check = time.monotonic() + check_interval
+        next_cleanup = None
+        
         while not self._stop_event.is_set():
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                if next_cleanup is None:
+                    next_cleanup = self._next_cleanup_time()
+                
+                if time.monotonic() >= next_check:
+                    self.process_pending_uploads()
+                    next_check = time.monotonic() + check_interval
+                
+                if time.time() >= next_cleanup:
+                    self.queue.cleanup_completed()
+                    next_cleanup = self._next_cleanup_time()
+                
+                # Dormir até o próximo evento (ou até stop_scheduler)
+                timeout = min(next_check - time.monotonic(), next_cleanup - time.time())
+                self._stop_event.wait(max(0.0, timeout))
             except Exception as e:
                 self.logger.error(f"Erro no loop do scheduler: {str(e)}")
-                time.sleep(10)
+                self._stop_event.wait(10)
         
         self.logger.info("Loop do scheduler finalizado")
     
@@ -574,9 +600,6 @@ class UploadScheduler:
             if self.scheduler_thread and self.scheduler_thread.is_alive():
                 self.scheduler_thread.join(timeout=5)
             
-            # Limpar schedule
-            schedule.clear()
-            
             self.logger.info("Scheduler parado")
             
         except Exception as e:
@@ -6,11 +6,58 @@ Sistema com opção de escolher quantos vídeos postar
 
 import os
 import sys
+import json
 import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from youtube_uploader import YouTubeUploader
 from video_processor import VideoProcessor
 
-def main():
+# Extensões de vídeo aceitas para upload (tupla: um único endswith em C)
+_VIDEO_EXTS = ('.mp4', '.mov', '.mkv', '.webm')
+
+# Cache da listagem de shorts, invalidado pelo mtime do diretório
+SHORTS_LISTING_CACHE = "temp/cache/shorts_listing.json"
+
+# Uploads simultâneos por padrão (upload é limitado pela rede, não pela CPU)
+DEFAULT_MAX_WORKERS = 3
+
+# Intervalo mínimo entre o início de dois uploads, somando todos os workers
+UPLOAD_INTERVAL = 30
+
+# Prompts de "pressione Enter" só fazem sentido com terminal interativo
+_IS_TTY = sys.stdin.isatty()
+
+# Detalhes por etapa só com UPLOAD_SHORTS_VERBOSE=1; senão, uma linha por arquivo
+VERBOSE = bool(os.environ.get('UPLOAD_SHORTS_VERBOSE'))
+
+def _verbose(message):
+    """Imprime mensagem de progresso detalhado, se habilitado"""
+    if VERBOSE:
+        print(message)
+
+class _UploadGate:
+    """Cota da API e intervalo entre uploads compartilhados por todos os workers"""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self.quota_exceeded = False
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+    
+    def wait_turn(self, label):
+        """Aguarda a vez do próximo upload; False se a cota já foi excedida"""
+        # Lock mantido durante a espera: os workers entram um por vez, espaçados
+        with self._lock:
+            delay = self._next_start - time.monotonic()
+            if delay > 0 and not self.quota_exceeded:
+                _verbose(f"⏳ {label} Aguardando {delay:.0f}s...")
+                time.sleep(delay)
+            self._next_start = time.monotonic() + self.interval
+            return not self.quota_exceeded
+
+def main(max_workers=DEFAULT_MAX_WORKERS):
     """Função principal com menu interativo"""
     
     print("🚀 UPLOAD INTELIGENTE DE SHORTS - Your Name")
@@ -18,14 +65,15 @@ def main():
     
     # Verificar pasta de shorts
     shorts_dir = 'shorts'
-    if not os.path.exists(shorts_dir):
+    
+    # Listar arquivos disponíveis (nome e tamanho numa única varredura)
+    try:
+        shorts_listing = list_shorts(shorts_dir)
+    except FileNotFoundError:
         print("❌ Pasta 'shorts' não encontrada")
         print("💡 Execute primeiro: python3 production_script.py URL_VIDEO")
         sys.exit(1)
-    
-    # Listar arquivos disponíveis
-    shorts_files = [f for f in os.listdir(shorts_dir) if f.endswith('.mp4')]
-    shorts_files.sort()
+    shorts_files = [name for name, _ in shorts_listing]
     
     if not shorts_files:
         print("❌ Nenhum short encontrado")
@@ -33,8 +81,8 @@ def main():
         sys.exit(1)
     
     print(f"📁 SHORTS DISPONÍVEIS ({len(shorts_files)}):")
-    for i, file in enumerate(shorts_files, 1):
-        size = os.path.getsize(os.path.join(shorts_dir, file)) / (1024*1024)
+    for i, (file, size_bytes) in enumerate(shorts_listing, 1):
+        size = size_bytes / (1024*1024)
         print(f"   {i:2d}. {file} ({size:.1f} MB)")
     
     # Menu de opções
@@ -137,9 +185,10 @@ def main():
                 except Exception as e:
                     print(f"❌ Seleção inválida: {e}")
                     print("\n🔄 Tente novamente ou digite '0' para voltar")
-                    retry = input("👉 Pressione Enter para tentar novamente ou 0 para voltar: ").strip()
-                    if retry == "0":
-                        break
+                    if _IS_TTY:
+                        retry = input("👉 Pressione Enter para tentar novamente ou 0 para voltar: ").strip()
+                        if retry == "0":
+                            break
                     continue
                     
             if selection == "0":  # Se escolheu voltar
@@ -171,14 +220,14 @@ def main():
     confirm = input(f"\n✅ Confirma, cancela ou volta? [s/N/0]: ").lower()
     
     if confirm == "0":
-        main()  # Reinicia o menu principal
+        main(max_workers)  # Reinicia o menu principal
         return
     elif confirm not in ['s', 'sim', 'y', 'yes']:
         print("❌ Upload cancelado")
         sys.exit(0)
     
     # Realizar upload
-    success = upload_selected_shorts(videos_to_upload)
+    success = upload_selected_shorts(videos_to_upload, max_workers)
     
     if success:
         print(f"\n🎉 UPLOAD CONCLUÍDO COM SUCESSO!")
@@ -187,6 +236,39 @@ def main():
         print(f"\n❌ Problemas durante o upload")
         sys.exit(1)
 
+def list_shorts(shorts_dir):
+    """Lista (nome, tamanho em bytes) dos shorts de vídeo, ordenados por nome"""
+    # stat antes da varredura: uma mudança durante o scan invalida o cache na próxima chamada
+    dir_stat = os.stat(shorts_dir)
+    dir_path = os.path.abspath(shorts_dir)
+    
+    try:
+        with open(SHORTS_LISTING_CACHE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if (cache['dir'] == dir_path and cache['mtime_ns'] == dir_stat.st_mtime_ns
+                and tuple(cache['exts']) == _VIDEO_EXTS):
+            return [(name, size) for name, size in cache['shorts']]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    with os.scandir(shorts_dir) as entries:
+        shorts = [(entry.name, entry.stat().st_size) for entry in entries
+                  if entry.name.lower().endswith(_VIDEO_EXTS) and entry.is_file()]
+    shorts.sort()
+    
+    try:
+        # Escrita atômica: arquivo temporário + rename
+        os.makedirs(os.path.dirname(SHORTS_LISTING_CACHE), exist_ok=True)
+        tmp_path = f"{SHORTS_LISTING_CACHE}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'dir': dir_path, 'mtime_ns': dir_stat.st_mtime_ns,
+                       'exts': _VIDEO_EXTS, 'shorts': shorts}, f)
+        os.replace(tmp_path, SHORTS_LISTING_CACHE)
+    except OSError:
+        pass
+    
+    return shorts
+
 def parse_selection(selection, max_num):
     """Parseia seleção de vídeos"""
     indices = set()
@@ -208,13 +290,13 @@ def parse_selection(selection, max_num):
     
     return sorted(list(indices))
 
-def upload_selected_shorts(videos_to_upload):
+def upload_selected_shorts(videos_to_upload, max_workers=DEFAULT_MAX_WORKERS):
     """Faz upload dos shorts selecionados"""
     
     print(f"\n🔧 INICIANDO UPLOAD...")
     print("=" * 50)
     
-    # Inicializar uploader
+    # Inicializar uploader (autenticação interativa, se necessária, acontece aqui)
     uploader = YouTubeUploader()
     
     if not uploader.authenticate():
@@ -223,92 +305,120 @@ def upload_selected_shorts(videos_to_upload):
     
     print("✅ Autenticação YouTube OK!")
     
-    uploaded_count = 0
-    failed_count = 0
-    shorts_dir = 'shorts'
+    total = len(videos_to_upload)
+    max_workers = max(1, min(max_workers, total))
+    print(f"⚡ Uploads simultâneos: {max_workers}")
     
-    for i, filename in enumerate(videos_to_upload, 1):
-        file_path = os.path.join(shorts_dir, filename)
-        
-        print(f"\n⬆️  [{i}/{len(videos_to_upload)}] {filename}")
-        print("-" * 40)
-        
-        # Validar formato
-        print("🔍 Validando formato...")
-        processor = VideoProcessor()
-        video_info = processor.load_video(file_path)
-        
-        if not video_info:
-            print("❌ Erro ao carregar vídeo - pulando...")
-            failed_count += 1
-            processor.cleanup()
-            continue
-        
-        shorts_format = video_info['validation']['shorts_format']
-        
-        if shorts_format['is_shorts_format']:
-            print("✅ Formato perfeito para YouTube Shorts!")
-        else:
-            print(f"⚠️  Formato será aceito: {video_info['width']}x{video_info['height']}")
-        
-        processor.cleanup()
-        
-        # Gerar metadados
-        title = generate_title(filename)
-        description = generate_description(filename)
-        tags = generate_tags(filename)
-        
-        print(f"📝 Título: {title}")
-        
-        try:
-            # Upload
-            result = uploader.upload_video(
-                file_path=file_path,
-                title=title,
-                description=description,
-                tags=tags,
-                category='22',
-                privacy='public'
-            )
-            
-            if result and result.get('success'):
-                video_id = result.get('video_id')
-                uploaded_count += 1
-                print(f"✅ Upload concluído!")
-                print(f"🔗 https://youtu.be/{video_id}")
-                
-                # 🗑️ Apagar arquivo após upload bem-sucedido
-                try:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                        print(f"🗑️ Arquivo removido: {filename}")
-                except Exception as e:
-                    print(f"⚠️ Erro ao remover arquivo: {e}")
-                
-                # Aguardar entre uploads
-                if i < len(videos_to_upload):
-                    print("⏳ Aguardando 30s...")
-                    time.sleep(30)
+    # Cota e intervalo globais; por thread fica só o serviço da API (não é thread-safe)
+    gate = _UploadGate(UPLOAD_INTERVAL)
+    worker_state = threading.local()
+    
+    def upload_worker(job):
+        i, filename = job
+        if getattr(worker_state, 'uploader', None) is None:
+            if max_workers == 1:
+                worker_state.uploader = uploader
             else:
-                failed_count += 1
-                print("❌ Upload falhou")
-                
-        except Exception as e:
-            failed_count += 1
-            print(f"❌ Erro: {e}")
+                worker_state.uploader = YouTubeUploader()
+                if not worker_state.uploader.authenticate():
+                    worker_state.uploader = None
+                    print(f"❌ [{i}/{total}] Falha na autenticação do YouTube")
+                    return False
+        
+        return upload_single_short(worker_state.uploader, filename, f"[{i}/{total}]", gate)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(upload_worker, enumerate(videos_to_upload, 1)))
+    
+    uploaded_count = sum(results)
+    failed_count = total - uploaded_count
     
     # Resumo final
     print("\n" + "="*50)
     print("📊 RESULTADO FINAL:")
     print(f"   ✅ Sucessos: {uploaded_count}")
     print(f"   ❌ Falhas: {failed_count}")
-    print(f"   📊 Total: {len(videos_to_upload)}")
+    print(f"   📊 Total: {total}")
     
     return uploaded_count > 0
 
+def upload_single_short(uploader, filename, label, gate):
+    """Valida e faz upload de um short; retorna True se o upload teve sucesso"""
+    shorts_dir = 'shorts'
+    file_path = os.path.join(shorts_dir, filename)
+    
+    _verbose(f"\n⬆️  {label} {filename}")
+    
+    # Validar formato
+    processor = VideoProcessor()
+    video_info = processor.get_video_info_cached(file_path)
+    
+    if not video_info:
+        print(f"❌ {label} {filename}: erro ao carregar vídeo - pulando...")
+        processor.cleanup()
+        return False
+    
+    shorts_format = video_info['validation']['shorts_format']
+    
+    if shorts_format['is_shorts_format']:
+        _verbose(f"✅ {label} Formato perfeito para YouTube Shorts!")
+    else:
+        _verbose(f"⚠️  {label} Formato será aceito: {video_info['width']}x{video_info['height']}")
+    
+    processor.cleanup()
+    
+    # Gerar metadados
+    title = generate_title(filename)
+    description = generate_description(filename)
+    tags = generate_tags(filename)
+    
+    _verbose(f"📝 {label} Título: {title}")
+    
+    # Esperar o intervalo global; com a cota excedida por qualquer worker, não chamar a API
+    if not gate.wait_turn(label):
+        print(f"❌ {label} {filename}: quota da API excedida - pulando...")
+        return False
+    
+    try:
+        # Upload
+        result = uploader.upload_video(
+            file_path=file_path,
+            title=title,
+            description=description,
+            tags=tags,
+            category='22',
+            privacy='public'
+        )
+        
+        if result and result.get('success'):
+            video_id = result.get('video_id')
+            print(f"✅ {label} {filename} → https://youtu.be/{video_id}")
+            
+            # 🗑️ Apagar arquivo após upload bem-sucedido
+            try:
+                os.remove(file_path)
+                _verbose(f"🗑️ {label} Arquivo removido: {filename}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"⚠️ {label} Erro ao remover arquivo: {e}")
+            
+            return True
+        
+        print(f"❌ {label} {filename}: upload falhou")
+        return False
+        
+    except Exception as e:
+        print(f"❌ {label} {filename}: {e}")
+        return False
+    
+    finally:
+        if uploader.quota_exceeded:
+            gate.quota_exceeded = True
+
 def get_video_info(filename):
     """Extrai informações do vídeo original para gerar conteúdo relevante"""
-    base_name = filename.replace('.mp4', '')
+    base_name = os.path.splitext(filename)[0]
     
     # Remover sufixos de formato
     clean_name = base_name
@@ -321,22 +431,26 @@ def get_video_info(filename):
     
     # Buscar informações do vídeo original no diretório downloads
     downloads_dir = './downloads'
-    if os.path.exists(downloads_dir):
-        for file in os.listdir(downloads_dir):
-            if clean_name.lower() in file.lower() and file.endswith('.info.json'):
-                try:
-                    import json
-                    with open(os.path.join(downloads_dir, file), 'r', encoding='utf-8') as f:
-                        info = json.load(f)
-                        return {
-                            'title': info.get('title', ''),
-                            'description': info.get('description', ''),
-                            'tags': info.get('tags', []),
-                            'channel': info.get('uploader', ''),
-                            'duration': info.get('duration', 0)
-                        }
-                except:
-                    pass
+    clean_name_lower = clean_name.lower()
+    try:
+        with os.scandir(downloads_dir) as entries:
+            info_paths = [entry.path for entry in entries
+                          if entry.name.endswith('.info.json') and clean_name_lower in entry.name.lower()]
+    except FileNotFoundError:
+        info_paths = []
+    for info_path in info_paths:
+        try:
+            with open(info_path, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+                return {
+                    'title': info.get('title', ''),
+                    'description': info.get('description', ''),
+                    'tags': info.get('tags', []),
+                    'channel': info.get('uploader', ''),
+                    'duration': info.get('duration', 0)
+                }
+        except:
+            pass
     
     return {'title': clean_name, 'description': '', 'tags': [], 'channel': '', 'duration': 0}
 
@@ -344,7 +458,7 @@ def generate_title(filename):
     """Gera título baseado no conteúdo do vídeo"""
     import re
     
-    base_name = filename.replace('.mp4', '')
+    base_name = os.path.splitext(filename)[0]
     video_info = get_video_info(filename)
     original_title = video_info['title']
     
@@ -559,4 +673,8 @@ def generate_tags(filename):
     ]
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Upload inteligente de shorts")
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f'Uploads simultâneos (padrão: {DEFAULT_MAX_WORKERS})')
+    args = parser.parse_args()
+    main(max(1, args.max_workers))
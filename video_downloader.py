@@ -7,11 +7,24 @@ Canal: Your_Channel_Name
 
 import os
 import re
+import json
+import time
 import logging
 import yt_dlp
 from typing import Dict, Optional, Callable
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, urlsplit, parse_qs
+
+# Informações extraídas por get_video_info, uma entrada por ID de vídeo
+YTDL_INFO_CACHE_DIR = "temp/cache/ytdl"
+# Validade do cache (views/likes e título mudam; a entrada é refeita depois disso)
+YTDL_INFO_CACHE_TTL = 6 * 3600
+
+# Hosts aceitos e prefixos de caminho que carregam o ID do vídeo
+_YT_HOSTS = frozenset({'youtube.com', 'www.youtube.com', 'm.youtube.com'})
+_YT_SHORT_HOSTS = frozenset({'youtu.be', 'www.youtu.be'})
+_YT_ID_PATH_PREFIXES = ('/embed/', '/v/')
+_YT_ID_RE = re.compile(r'[\w-]+')
 
 class VideoDownloader:
     """Classe para download de vídeos do YouTube"""
@@ -28,15 +41,29 @@ class VideoDownloader:
     
     def validate_youtube_url(self, url: str) -> bool:
         """Valida se a URL é do YouTube"""
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/v/[\w-]+'
-        ]
+        # Um único parse; host comparado por igualdade (rejeita evil.com/youtube.com)
+        try:
+            parts = urlsplit(url if '://' in url else f"https://{url}")
+        except ValueError:  # Ex.: colchete IPv6 sem fechamento ('http://[::1')
+            self.logger.error(f"URL inválida do YouTube: {url}")
+            return False
+        host = (parts.hostname or '').lower()
+        path = parts.path
         
-        for pattern in youtube_patterns:
-            if re.match(pattern, url):
+        if parts.scheme in ('http', 'https'):
+            if host in _YT_SHORT_HOSTS:
+                video_id = path[1:]
+            elif host in _YT_HOSTS:
+                if path == '/watch':
+                    video_id = parse_qs(parts.query).get('v', [''])[0]
+                elif path.startswith(_YT_ID_PATH_PREFIXES):
+                    video_id = path.split('/', 3)[2]
+                else:
+                    video_id = ''
+            else:
+                video_id = ''
+            
+            if _YT_ID_RE.match(video_id):
                 self.logger.info(f"URL válida do YouTube: {url}")
                 return True
         
@@ -80,6 +107,19 @@ class VideoDownloader:
         """Extrai informações do vídeo sem fazer download"""
         if not self.validate_youtube_url(url):
             return None
+        
+        # Reaproveitar extração anterior do mesmo vídeo
+        video_id = self.extract_video_id(url)
+        cache_path = os.path.join(YTDL_INFO_CACHE_DIR, f"{video_id}.json") if video_id else None
+        if cache_path:
+            try:
+                if time.time() - os.path.getmtime(cache_path) < YTDL_INFO_CACHE_TTL:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        video_info = json.load(f)
+                    self.logger.info(f"Informações em cache: {video_info['title']} ({video_info['duration']}s)")
+                    return video_info
+            except (OSError, ValueError, KeyError):
+                pass
             
         ydl_opts = {
             'quiet': True,
@@ -110,6 +150,18 @@ class VideoDownloader:
                 }
                 
                 self.logger.info(f"Informações extraídas: {video_info['title']} ({video_info['duration']}s)")
+                
+                if cache_path:
+                    try:
+                        # Escrita atômica: arquivo temporário + rename
+                        os.makedirs(YTDL_INFO_CACHE_DIR, exist_ok=True)
+                        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                        with open(tmp_path, 'w', encoding='utf-8') as f:
+                            json.dump(video_info, f, ensure_ascii=False)
+                        os.replace(tmp_path, cache_path)
+                    except Exception as e:
+                        self.logger.warning(f"Erro ao salvar cache de informações: {str(e)}")
+                
                 return video_info
                 
         except Exception as e:
@@ -152,8 +204,8 @@ class VideoDownloader:
                 if duration < 300:  # Menos de 5 minutos
                     self.logger.warning(f"Vídeo muito curto ({duration}s), pode não ser adequado para shorts")
                 
-                # Faz o download
-                ydl.download([url])
+                # Faz o download a partir da extração já feita (sem nova requisição ao extrator)
+                info = ydl.process_ie_result(info, download=True)
                 
                 # Monta informações de retorno
                 # Usar o filename real que foi baixado
@@ -209,47 +261,64 @@ class VideoDownloader:
         Returns:
             Caminho do arquivo encontrado ou None
         """
-        if not os.path.exists(self.download_dir):
-            return None
+        # Remover caracteres especiais para comparação (uma vez por busca)
+        clean_title = re.sub(r'[^\w\s-]', '', title.lower())
         
-        # Procurar arquivos MP4 no diretório
-        for filename in os.listdir(self.download_dir):
-            if filename.endswith('.mp4'):
-                file_path = os.path.join(self.download_dir, filename)
-                
-                # Verificar se o título está contido no nome do arquivo
-                # Remover caracteres especiais para comparação
-                clean_title = re.sub(r'[^\w\s-]', '', title.lower())
-                clean_filename = re.sub(r'[^\w\s-]', '', filename.lower())
-                
-                if clean_title in clean_filename or (video_id and video_id in filename):
-                    self.logger.info(f"Arquivo encontrado: {filename}")
-                    return file_path
+        # Procurar arquivos MP4 no diretório em uma única listagem
+        try:
+            with os.scandir(self.download_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not filename.endswith('.mp4') or not entry.is_file():
+                        continue
+                    
+                    # Verificar se o título está contido no nome do arquivo
+                    clean_filename = re.sub(r'[^\w\s-]', '', filename.lower())
+                    
+                    if clean_title in clean_filename or (video_id and video_id in filename):
+                        self.logger.info(f"Arquivo encontrado: {filename}")
+                        return entry.path
+        except FileNotFoundError:
+            return None
         
         self.logger.warning(f"Arquivo não encontrado para título: {title}")
         return None
 
     def cleanup_downloads(self, max_age_days: int = 7):
         """Remove downloads antigos para economizar espaço"""
-        if not os.path.exists(self.download_dir):
-            return
-            
         current_time = datetime.now()
         removed_count = 0
         
-        for filename in os.listdir(self.download_dir):
-            file_path = os.path.join(self.download_dir, filename)
-            if os.path.isfile(file_path):
-                file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-                age_days = (current_time - file_time).days
-                
-                if age_days > max_age_days:
-                    try:
-                        os.remove(file_path)
-                        removed_count += 1
-                        self.logger.info(f"Removido arquivo antigo: {filename}")
-                    except Exception as e:
-                        self.logger.error(f"Erro ao remover {filename}: {str(e)}")
+        try:
+            with os.scandir(self.download_dir) as entries:
+                old_files = [(entry.name, entry.path) for entry in entries
+                             if entry.is_file() and
+                             (current_time - datetime.fromtimestamp(entry.stat().st_ctime)).days > max_age_days]
+        except FileNotFoundError:
+            return
+        
+        for filename, file_path in old_files:
+            try:
+                os.remove(file_path)
+                removed_count += 1
+                self.logger.info(f"Removido arquivo antigo: {filename}")
+            except Exception as e:
+                self.logger.error(f"Erro ao remover {filename}: {str(e)}")
+        
+        # Entradas vencidas do cache de informações (vídeos não consultados de novo)
+        cutoff = time.time() - YTDL_INFO_CACHE_TTL
+        try:
+            with os.scandir(YTDL_INFO_CACHE_DIR) as entries:
+                expired = [entry.path for entry in entries
+                           if entry.is_file() and entry.stat().st_mtime < cutoff]
+        except FileNotFoundError:
+            expired = []
+        
+        for cache_path in expired:
+            try:
+                os.remove(cache_path)
+            except OSError as e:
+                self.logger.warning(f"Erro ao remover cache {cache_path}: {str(e)}")
         
         if removed_count > 0:
             self.logger.info(f"Limpeza concluída: {removed_count} arquivos removidos")
@@ -6,6 +6,9 @@ Canal: Your_Channel_Name
 """
 
 import os
+import json
+import time
+import hashlib
 import logging
 import shutil
 from typing import Dict, Optional, Tuple
@@ -36,6 +39,11 @@ except ImportError as e:
     NUMPY_AVAILABLE = False
     np = None
 
+# Cache em disco das informações extraídas por load_video
+VIDEO_META_CACHE_DIR = "temp/cache/video_meta"
+# Entradas não reescritas há mais que isso são removidas (versões antigas/vídeos apagados)
+VIDEO_META_CACHE_MAX_AGE = 7 * 24 * 3600
+
 class VideoProcessor:
     """Classe para processamento e validação de vídeos"""
     
@@ -110,6 +118,64 @@ class VideoProcessor:
             self.logger.error(f"Erro ao carregar vídeo {video_path}: {str(e)}")
             return None
     
+    def get_video_info_cached(self, video_path: str) -> Optional[Dict]:
+        """
+        Retorna as informações de load_video usando cache em disco
+        
+        A chave do cache inclui mtime e tamanho do arquivo, então qualquer
+        alteração no vídeo invalida a entrada. Em um acerto de cache o clip
+        não é aberto (current_video não é carregado).
+        
+        Args:
+            video_path: Caminho para o arquivo de vídeo
+            
+        Returns:
+            Dict com informações técnicas ou None se falhou
+        """
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            self.logger.error(f"Arquivo não encontrado: {video_path}")
+            return None
+        
+        key = f"{os.path.abspath(video_path)}:{st.st_mtime_ns}:{st.st_size}"
+        cache_path = os.path.join(VIDEO_META_CACHE_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                video_info = json.load(f)
+            self.logger.debug(f"Informações do vídeo em cache: {video_path}")
+            self.video_info = video_info
+            return video_info
+        except (OSError, ValueError):
+            pass
+        
+        video_info = self.load_video(video_path)
+        if video_info:
+            try:
+                # Escrita atômica: arquivo temporário + rename
+                os.makedirs(VIDEO_META_CACHE_DIR, exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(video_info, f, ensure_ascii=False, default=str)
+                os.replace(tmp_path, cache_path)
+                self._prune_video_meta_cache()
+            except Exception as e:
+                self.logger.warning(f"Erro ao salvar cache do vídeo: {str(e)}")
+        
+        return video_info
+    
+    def _prune_video_meta_cache(self):
+        """Remove entradas antigas do cache (a chave muda a cada versão do vídeo)"""
+        cutoff = time.time() - VIDEO_META_CACHE_MAX_AGE
+        with os.scandir(VIDEO_META_CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass  # Removida por outro processo
+    
     def _get_opencv_info(self, video_path: str) -> Optional[Dict]:
         """Extrai informações adicionais usando OpenCV"""
         try:
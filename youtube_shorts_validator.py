@@ -321,13 +321,20 @@ class YouTubeShortsValidator:
             # Muito estreito - letterbox
             return self._add_letterbox(video)
     
+    def _list_video_files(self, directory: str) -> List[str]:
+        """Lista os arquivos de vídeo do diretório numa única varredura"""
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries
+                    if entry.name.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm'))
+                    and entry.is_file()]
+    
     def batch_validate(self, directory: str) -> List[Dict]:
         """Valida todos os vídeos em um diretório"""
         if not os.path.exists(directory):
             self.logger.error(f"Diretório não encontrado: {directory}")
             return []
         
-        video_files = [f for f in os.listdir(directory) if f.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm'))]
+        video_files = self._list_video_files(directory)
         
         if not video_files:
             self.logger.warning(f"Nenhum vídeo encontrado em: {directory}")
@@ -349,7 +356,7 @@ class YouTubeShortsValidator:
         
         os.makedirs(output_dir, exist_ok=True)
         
-        video_files = [f for f in os.listdir(directory) if f.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.webm'))]
+        video_files = self._list_video_files(directory)
         converted_files = []
         
         for video_file in video_files:
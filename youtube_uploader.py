@@ -20,6 +20,12 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 import threading
 
+# Credenciais autenticadas por arquivo de credenciais (compartilhadas no processo)
+_CREDENTIALS_CACHE: Dict[str, object] = {}
+_CREDENTIALS_LOCK = threading.Lock()
+# Serviços da API por thread: o transporte httplib2 não é thread-safe
+_SERVICE_CACHE = threading.local()
+
 class YouTubeUploader:
     """Classe para upload automático de vídeos no YouTube"""
     
@@ -37,7 +43,7 @@ class YouTubeUploader:
             'default_privacy': 'public',
             'max_retries': 3,
             'retry_delay': 5,
-            'chunk_size': 1024 * 1024,  # 1MB chunks
+            'chunk_size': 8 * 1024 * 1024,  # 8MB chunks (menos round-trips por upload)
             'rate_limit_delay': 1  # 1 segundo entre uploads
         }
         
@@ -59,11 +65,28 @@ class YouTubeUploader:
         Returns:
             True se autenticação bem-sucedida
         """
+        credentials_file = self.config['credentials_file']
+        
+        # Reaproveitar serviço já autenticado nesta thread
+        services = getattr(_SERVICE_CACHE, 'services', None)
+        if services is None:
+            services = _SERVICE_CACHE.services = {}
+        cached_service = services.get(credentials_file)
+        with _CREDENTIALS_LOCK:
+            cached_credentials = _CREDENTIALS_CACHE.get(credentials_file)
+        if cached_service is not None and cached_credentials is not None and cached_credentials.valid:
+            self.credentials = cached_credentials
+            self.service = cached_service
+            self.logger.info("Reutilizando autenticação em cache")
+            return True
+        
         try:
             self.logger.info("Iniciando autenticação OAuth 2.0")
             
-            # Verificar se já temos credenciais salvas
-            if os.path.exists(self.config['credentials_file']):
+            # Verificar se já temos credenciais em memória ou salvas
+            if cached_credentials is not None:
+                self.credentials = cached_credentials
+            elif os.path.exists(credentials_file):
                 self.logger.info("Carregando credenciais salvas")
                 with open(self.config['credentials_file'], 'rb') as token:
                     self.credentials = pickle.load(token)
@@ -99,12 +122,16 @@ class YouTubeUploader:
                 
                 self.logger.info("Credenciais salvas")
             
+            with _CREDENTIALS_LOCK:
+                _CREDENTIALS_CACHE[credentials_file] = self.credentials
+            
             # Criar serviço da API
             self.service = build(
                 self.config['api_service_name'],
                 self.config['api_version'],
                 credentials=self.credentials
             )
+            services[credentials_file] = self.service
             
             # Testar conexão
             self._test_connection()
@@ -264,8 +291,10 @@ class YouTubeUploader:
                 if not self.authenticate():
                     raise Exception("Falha na autenticação")
             
-            # Verificar se arquivo existe
-            if not os.path.exists(file_path):
+            # Verificar se arquivo existe (stat único, reaproveitado no resultado)
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
             
             # Verificar quota
@@ -301,7 +330,7 @@ class YouTubeUploader:
             if video_id:
                 # Upload bem-sucedido
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
-                file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                file_size_mb = file_stat.st_size / (1024 * 1024)
                 
                 result = {
                     'success': True,
@@ -367,8 +396,10 @@ class YouTubeUploader:
                 if not self.authenticate():
                     raise Exception("Falha na autenticação")
             
-            # Verificar se arquivo existe
-            if not os.path.exists(file_path):
+            # Verificar se arquivo existe (stat único, reaproveitado no resultado)
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
             
             # Verificar quota
@@ -404,7 +435,7 @@ class YouTubeUploader:
             if video_id:
                 # Upload bem-sucedido
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
-                file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                file_size_mb = file_stat.st_size / (1024 * 1024)
                 
                 result = {
                     'success': True,